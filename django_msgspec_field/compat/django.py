@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import abc
 import dataclasses
+import functools
+import operator
 import sys
 import types
 import typing as ty
@@ -23,7 +25,21 @@ from .typing import get_args, get_origin
 class BaseContainer(abc.ABC):
     """Base container class for migration serialization."""
 
-    __slot__ = ()
+    __slots__ = ()
+
+    _slot_getter: ty.ClassVar[ty.Callable[[ty.Any], tuple[ty.Any, ...]]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        slots = getattr(cls, "__slots__", ())
+        slots = (slots,) if isinstance(slots, str) else tuple(slots)
+        if len(slots) > 1:
+            cls._slot_getter = operator.attrgetter(*slots)
+        elif slots:
+            getter = operator.attrgetter(*slots)
+            cls._slot_getter = staticmethod(lambda obj: (getter(obj),))  # type: ignore[assignment]
+        else:
+            cls._slot_getter = staticmethod(lambda obj: ())  # type: ignore[assignment]
 
     @classmethod
     def unwrap(cls, value):
@@ -33,21 +49,21 @@ class BaseContainer(abc.ABC):
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return all(getattr(self, attr) == getattr(other, attr) for attr in self.__slots__)
+            return self._slot_getter(self) == other._slot_getter(other)
         return NotImplemented
 
     def __str__(self):
         return repr(self.unwrap(self))
 
     def __repr__(self):
-        attrs = tuple(getattr(self, attr) for attr in self.__slots__)
-        return f"{self.__class__.__name__}{attrs}"
+        return f"{self.__class__.__name__}{self._slot_getter(self)!r}"
 
 
 class GenericContainer(BaseContainer):
     """Container for generic type annotations in migrations."""
 
-    __slots__ = "args", "origin"
+    # The slots are the `__init__` arguments in order: `BaseContainerSerializer` renders them positionally
+    __slots__ = "origin", "args"  # noqa: RUF023
 
     def __init__(self, origin, args: tuple = ()):
         self.origin = origin
@@ -55,6 +71,14 @@ class GenericContainer(BaseContainer):
 
     @classmethod
     def wrap(cls, value):
+        # Plain classes and atomic values are never wrapped.
+        # `issubclass` on the type is used since `isinstance(list[int], type)` is true on Python 3.10.
+        if type(value) in _ATOMIC_TYPES or issubclass(type(value), type):
+            return value
+        return _memoized(_WRAP_CACHE, cls, value, cls._wrap)
+
+    @classmethod
+    def _wrap(cls, value):
         # Handle Annotated aliases
         if isinstance(value, AnnotatedAlias):
             args = (value.__origin__, *value.__metadata__)
@@ -69,25 +93,21 @@ class GenericContainer(BaseContainer):
     def unwrap(cls, value):
         if not isinstance(value, cls):
             return value
+        return _memoized(_UNWRAP_CACHE, cls, value, cls._unwrap)
 
+    @classmethod
+    def _unwrap(cls, value):
         origin = value.origin
 
         if not value.args:
             return origin
 
-        unwrapped_args = tuple(map(BaseContainer.unwrap, value.args))
-
-        # Special handling for UnionType - must use | operator to reconstruct
-        if origin is types.UnionType:
-            result = unwrapped_args[0]
-            for arg in unwrapped_args[1:]:
-                result = result | arg
-            return result
+        if any(isinstance(arg, BaseContainer) for arg in value.args):
+            unwrapped_args = tuple(map(BaseContainer.unwrap, value.args))
+        else:
+            unwrapped_args = tuple(value.args)
 
-        try:
-            return origin[unwrapped_args]
-        except TypeError:
-            return types.GenericAlias(origin, unwrapped_args)
+        return _GENERIC_CONSTRUCTORS.get(origin, _subscript_generic)(origin, unwrapped_args)
 
     def __eq__(self, other):
         if isinstance(other, GenericTypes):
@@ -95,6 +115,72 @@ class GenericContainer(BaseContainer):
         return super().__eq__(other)
 
 
+_ATOMIC_TYPES = frozenset({type, str, int, float, bool, bytes, type(None)})
+
+
+def _subscript_generic(origin: ty.Any, args: tuple) -> ty.Any:
+    try:
+        return origin[args]
+    except TypeError:
+        return types.GenericAlias(origin, args)
+
+
+def _union_generic(origin: ty.Any, args: tuple) -> ty.Any:
+    # `types.UnionType` cannot be subscripted, it is rebuilt with the `|` operator
+    return functools.reduce(operator.or_, args)
+
+
+# Origins which cannot be rebuilt by subscription, `_subscript_generic` handles the rest
+_GENERIC_CONSTRUCTORS: dict[ty.Any, ty.Callable[[ty.Any, tuple], ty.Any]] = {}
+if sys.version_info >= (3, 10):
+    _GENERIC_CONSTRUCTORS[types.UnionType] = _union_generic
+
+
+# Type objects are immutable, so the wrapped/unwrapped forms are memoized. Cache keys are built
+# with `_type_strict_key`, since plain equality conflates e.g. `Literal[1]` args with `Literal[True]`.
+# Unhashable values (e.g. containers holding lists) always take the uncached path.
+_MEMO_CACHE_MAXSIZE = 1024
+_WRAP_CACHE: dict[ty.Hashable, ty.Any] = {}
+_UNWRAP_CACHE: dict[ty.Hashable, ty.Any] = {}
+
+
+def _memoized(cache: dict[ty.Hashable, ty.Any], container_cls: type, value: ty.Any, func: ty.Callable) -> ty.Any:
+    try:
+        key = (container_cls, _type_strict_key(value))
+        return cache[key]
+    except TypeError:
+        return func(value)
+    except KeyError:
+        pass
+
+    result = cache[key] = func(value)
+    if len(cache) > _MEMO_CACHE_MAXSIZE:
+        del cache[next(iter(cache))]
+    return result
+
+
+def _type_strict_key(value: ty.Any) -> ty.Hashable:
+    """Build a hashable key for a (possibly wrapped) type, which also includes the type of every argument."""
+    if isinstance(value, GenericContainer):
+        return type(value), _type_strict_key(value.origin), _type_strict_key(value.args)
+    if isinstance(value, AnnotatedAlias):
+        return type(value), _type_strict_key(value.__origin__), _type_strict_key(value.__metadata__)
+    if isinstance(value, GenericTypes):
+        return type(value), _type_strict_key(get_origin(value)), _type_strict_key(get_args(value))
+    if type(value) is tuple:
+        return tuple, tuple(map(_type_strict_key, value))
+    hash(value)
+    return type(value), value
+
+
+def _is_hashable(value: ty.Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 class DataclassContainer(BaseContainer):
     """Container for dataclass instances in migrations."""
 
@@ -107,7 +193,7 @@ class DataclassContainer(BaseContainer):
     @classmethod
     def wrap(cls, value):
         if cls._is_dataclass_instance(value):
-            return cls(type(value), dataclasses.asdict(value))
+            return cls(type(value), {name: getattr(value, name) for name in _dataclass_field_names(type(value))})
         if isinstance(value, GenericTypes):
             return GenericContainer.wrap(value)
         return value
@@ -120,7 +206,12 @@ class DataclassContainer(BaseContainer):
 
     @staticmethod
     def _is_dataclass_instance(obj: ty.Any):
-        return dataclasses.is_dataclass(obj) and not isinstance(obj, type)
+        # Classes themselves have a metaclass as their type, which is never a dataclass
+        obj_type = type(obj)
+        is_dataclass = _IS_DATACLASS_CACHE.get(obj_type)
+        if is_dataclass is None:
+            is_dataclass = _IS_DATACLASS_CACHE[obj_type] = dataclasses.is_dataclass(obj_type)
+        return is_dataclass
 
     def __eq__(self, other):
         if self._is_dataclass_instance(other):
@@ -128,6 +219,14 @@ class DataclassContainer(BaseContainer):
         return super().__eq__(other)
 
 
+_IS_DATACLASS_CACHE: dict[type, bool] = {}
+
+
+@functools.cache
+def _dataclass_field_names(datacls: type) -> tuple[str, ...]:
+    return tuple(field.name for field in dataclasses.fields(datacls))
+
+
 class BaseContainerSerializer(BaseSerializer):
     """Serializer for BaseContainer instances."""
 
@@ -146,9 +245,7 @@ class BaseContainerSerializer(BaseSerializer):
         return f"{tp_repr}({attrs_repr})", imports
 
     def _iter_container_attrs(self):
-        container = self.value
-        for attr in container.__slots__:
-            yield getattr(container, attr)
+        return self.value._slot_getter(self.value)
 
 
 class DataclassContainerSerializer(BaseSerializer):
@@ -161,7 +258,8 @@ class DataclassContainerSerializer(BaseSerializer):
 
         kwarg_pairs = []
         for arg, value in self.value.kwargs.items():
-            value_repr, value_imports = serializer_factory(value).serialize()
+            # Nested dataclasses are rendered as constructor calls via the same container
+            value_repr, value_imports = serializer_factory(_wrap_nested_dataclasses(value)).serialize()
             kwarg_pairs.append(f"{arg}={value_repr}")
             imports.update(value_imports)
 
@@ -169,6 +267,15 @@ class DataclassContainerSerializer(BaseSerializer):
         return f"{tp_repr}({kwargs_repr})", imports
 
 
+def _wrap_nested_dataclasses(value: ty.Any) -> ty.Any:
+    """Wrap dataclass instances, including those nested in lists, tuples and dict values."""
+    if type(value) in (list, tuple):
+        return type(value)(map(_wrap_nested_dataclasses, value))
+    if type(value) is dict:
+        return {key: _wrap_nested_dataclasses(item) for key, item in value.items()}
+    return DataclassContainer.wrap(value)
+
+
 class TypingSerializer(BaseSerializer):
     """Serializer for typing module types."""
 
@@ -177,54 +284,72 @@ class TypingSerializer(BaseSerializer):
         if isinstance(value, GenericContainer):
             return serializer_factory(value).serialize()
 
-        orig_module = self.value.__module__
-        orig_repr = repr(self.value)
+        # Special forms like typing.Any or forward references are a small, closed set
+        cache_key = (type(self.value), self.value) if _is_hashable(self.value) else None
+        cached = _TYPING_REPR_CACHE.get(cache_key) if cache_key is not None else None
+        if cached is None:
+            orig_module = self.value.__module__
+            orig_repr = repr(self.value)
+
+            if not orig_repr.startswith(orig_module):
+                orig_repr = f"{orig_module}.{orig_repr}"
+
+            cached = orig_repr, f"import {orig_module}"
+            if cache_key is not None:
+                _TYPING_REPR_CACHE[cache_key] = cached
 
-        if not orig_repr.startswith(orig_module):
-            orig_repr = f"{orig_module}.{orig_repr}"
+        orig_repr, orig_import = cached
+        return orig_repr, {orig_import}
 
-        return orig_repr, {f"import {orig_module}"}
+
+_TYPING_REPR_CACHE: dict[tuple[type, ty.Any], tuple[str, str]] = {}
 
 
 AnnotatedAlias = te._AnnotatedAlias
 
 if sys.version_info >= (3, 14):
-    GenericTypes: tuple[ty.Any, ...] = (types.GenericAlias, type(list[int]), type(list), ty.Union)
+    GenericTypes: tuple[ty.Any, ...] = (types.GenericAlias, type(ty.List[int]), type(ty.List), ty.Union)
 elif sys.version_info >= (3, 10):
     GenericTypes = (
         types.GenericAlias,
-        type(list[int]),
-        type(list),
+        type(ty.List[int]),
+        type(ty.List),
         type(ty.Union[int, str]),
         types.UnionType,
     )
 else:
     GenericTypes = (
         types.GenericAlias,
-        type(list[int]),
-        type(list),
+        type(ty.List[int]),
+        type(ty.List),
         type(ty.Union[int, str]),
     )
 
 
-# BaseContainerSerializer *must be* registered after all specialized container serializers
-MigrationWriter.register_serializer(DataclassContainer, DataclassContainerSerializer)
-MigrationWriter.register_serializer(BaseContainer, BaseContainerSerializer)
-
-# Typing serializers
-for type_ in GenericTypes:
-    MigrationWriter.register_serializer(type_, TypingSerializer)
-
-MigrationWriter.register_serializer(ty.ForwardRef, TypingSerializer)
-MigrationWriter.register_serializer(type(ty.Union), TypingSerializer)  # type: ignore
-MigrationWriter.register_serializer(ty._SpecialForm, TypingSerializer)  # type: ignore
-
-
 if sys.version_info >= (3, 10):
     UnionType = (types.UnionType, type(ty.Union[int, str]))
 else:
     UnionType = (type(ty.Union[int, str]),)
 
+_UNION_ISINSTANCE_TYPES: tuple[ty.Any, ...] = (type(ty.Union), *UnionType)
+
+
+_register_serializer = MigrationWriter.register_serializer
+
+# BaseContainerSerializer *must be* registered after all specialized container serializers
+_register_serializer(DataclassContainer, DataclassContainerSerializer)
+_register_serializer(BaseContainer, BaseContainerSerializer)
+
+# Typing serializers, deduplicated. Union types are registered with UnionTypeSerializer below,
+# and plain classes (`type(ty.Union)` is `type` on Python 3.14+) are left to Django's TypeSerializer.
+_TYPING_SERIALIZER_TYPES: tuple[ty.Any, ...] = tuple(
+    type_
+    for type_ in dict.fromkeys((*GenericTypes, ty.ForwardRef, type(ty.Union), ty._SpecialForm))  # type: ignore[attr-defined]
+    if type_ not in UnionType and type_ is not type
+)
+for type_ in _TYPING_SERIALIZER_TYPES:
+    _register_serializer(type_, TypingSerializer)
+
 
 class UnionTypeSerializer(BaseSerializer):
     """Serializer for Union types."""
@@ -233,7 +358,7 @@ class UnionTypeSerializer(BaseSerializer):
 
     def serialize(self):
         imports = set()
-        if isinstance(self.value, (type(ty.Union), *UnionType)):  # type: ignore
+        if isinstance(self.value, _UNION_ISINSTANCE_TYPES):
             imports.add("import typing")
 
         for arg in get_args(self.value):
@@ -244,13 +369,29 @@ class UnionTypeSerializer(BaseSerializer):
 
 
 for union_type in UnionType:
-    MigrationWriter.register_serializer(union_type, UnionTypeSerializer)
+    _register_serializer(union_type, UnionTypeSerializer)
 
 
 # msgspec.Meta serializer
 try:
     import msgspec
 
+    _META_FIELDS = (
+        "gt",
+        "ge",
+        "lt",
+        "le",
+        "multiple_of",
+        "pattern",
+        "min_length",
+        "max_length",
+        "tz",
+        "title",
+        "description",
+        "examples",
+        "extra_json_schema",
+    )
+
     class MsgspecMetaSerializer(BaseSerializer):
         """Serializer for msgspec.Meta instances."""
 
@@ -259,39 +400,19 @@ try:
         def serialize(self):
             imports = {"import msgspec"}
 
-            # Get the Meta arguments as kwargs
+            # Get the Meta arguments which are set as kwargs
             meta = self.value
-            kwargs = {}
-
-            # Check all possible Meta fields
-            for field_name in (
-                "gt",
-                "ge",
-                "lt",
-                "le",
-                "multiple_of",
-                "pattern",
-                "min_length",
-                "max_length",
-                "tz",
-                "title",
-                "description",
-                "examples",
-                "extra_json_schema",
-            ):
-                field_value = getattr(meta, field_name, None)
-                if field_value is not None:
-                    kwargs[field_name] = field_value
+            kwargs = {name: value for name in _META_FIELDS if (value := getattr(meta, name, None)) is not None}
 
             kwarg_parts = []
             for k, v in kwargs.items():
                 v_repr, v_imports = serializer_factory(v).serialize()
                 kwarg_parts.append(f"{k}={v_repr}")
-                imports.update(v_imports)
+                imports |= v_imports
 
             kwargs_str = ", ".join(kwarg_parts)
             return f"msgspec.Meta({kwargs_str})", imports
 
-    MigrationWriter.register_serializer(msgspec.Meta, MsgspecMetaSerializer)
+    _register_serializer(msgspec.Meta, MsgspecMetaSerializer)
 except ImportError:
     pass
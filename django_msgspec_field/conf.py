@@ -21,8 +21,8 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import typing as ty
-from functools import lru_cache
 
 if ty.TYPE_CHECKING:
     from collections.abc import Callable
@@ -53,9 +53,7 @@ def import_from_string(value: str | ty.Any, setting_name: str) -> ty.Any:
     """
     if isinstance(value, str):
         try:
-            from django.utils.module_loading import import_string
-
-            return import_string(value)
+            return _import_string(value)
         except ImportError as e:
             raise ImportError(
                 f"Could not import '{value}' for setting '{setting_name}'. {e.__class__.__name__}: {e}."
@@ -63,6 +61,14 @@ def import_from_string(value: str | ty.Any, setting_name: str) -> ty.Any:
     return value
 
 
+@functools.lru_cache(maxsize=64)
+def _import_string(dotted_path: str) -> ty.Any:
+    # Settings are re-resolved after every reload, the imported objects themselves stay the same
+    from django.utils.module_loading import import_string
+
+    return import_string(dotted_path)
+
+
 class MsgspecFieldSettings:
     """
     A settings object that provides access to django-msgspec-field settings.
@@ -101,18 +107,13 @@ class MsgspecFieldSettings:
         if attr not in self.defaults:
             raise AttributeError(f"Invalid setting: '{attr}'")
 
-        try:
-            # Check if present in user settings
-            val = self.user_settings[attr]
-        except KeyError:
-            # Fall back to defaults
-            val = self.defaults[attr]
-
+        # Each setting is resolved on its own first access, so a bad import string only fails its own setting.
+        # The result is cached as an instance attribute, later accesses never reach `__getattr__`.
+        val = self.user_settings.get(attr, self.defaults[attr])
         # Coerce import strings into callables
-        if attr in self.import_strings:
+        if isinstance(val, str) and attr in self.import_strings:
             val = import_from_string(val, attr)
 
-        # Cache the result
         self._cached_attrs.add(attr)
         setattr(self, attr, val)
         return val
@@ -138,10 +139,15 @@ class MsgspecFieldSettings:
         return self.DEC_HOOK
 
 
-@lru_cache(maxsize=1)
+_SETTINGS_SINGLETON: MsgspecFieldSettings | None = None
+
+
 def get_settings() -> MsgspecFieldSettings:
     """Get the msgspec field settings singleton."""
-    return MsgspecFieldSettings()
+    global _SETTINGS_SINGLETON
+    if _SETTINGS_SINGLETON is None:
+        _SETTINGS_SINGLETON = MsgspecFieldSettings()
+    return _SETTINGS_SINGLETON
 
 
 # Expose a module-level settings object for convenient access
@@ -150,6 +156,6 @@ msgspec_field_settings = get_settings()
 
 def reload_settings() -> None:
     """Reload the settings from Django configuration."""
-    get_settings.cache_clear()
-    global msgspec_field_settings
+    global _SETTINGS_SINGLETON, msgspec_field_settings
+    _SETTINGS_SINGLETON = None
     msgspec_field_settings = get_settings()
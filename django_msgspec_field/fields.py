@@ -4,7 +4,9 @@ Django model field for storing msgspec-validated JSON data.
 
 from __future__ import annotations
 
+import copy
 import json
+import math
 import typing as ty
 
 import msgspec
@@ -12,12 +14,12 @@ import typing_extensions as te
 from django.core import checks, exceptions
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models.expressions import BaseExpression, Col, Value
-from django.db.models.fields import NOT_PROVIDED
+from django.db.models.fields import NOT_PROVIDED, BinaryField
 from django.db.models.fields.json import JSONField, KeyTransform
 from django.db.models.lookups import Transform
 from django.db.models.query_utils import DeferredAttribute
 
-from . import forms, types
+from . import conf, forms, types
 from .compat.django import BaseContainer, GenericContainer
 
 if ty.TYPE_CHECKING:
@@ -51,10 +53,27 @@ if ty.TYPE_CHECKING:
         # django.db.models.fields.json.JSONField kwargs
         encoder: ty.Callable[[], json.JSONEncoder]
         decoder: ty.Callable[[], json.JSONDecoder]
+        # django_msgspec_field.fields.MsgspecSchemaField kwargs
+        format: StorageFormat
 
 
 __all__ = ("MsgspecSchemaField", "SchemaField")
 
+StorageFormat = ty.Literal["json", "msgpack"]
+STORAGE_FORMATS: tuple[StorageFormat, ...] = ty.get_args(StorageFormat)
+
+_JSON_PARSE_ERRORS = (ValueError, msgspec.DecodeError, msgspec.ValidationError)
+_PREP_IGNORED_ERRORS = (msgspec.ValidationError, types.ImproperlyConfiguredSchema)
+
+# Lookups of MessagePack-stored fields are resolved as for binary columns, JSON lookups make no sense there
+_BINARY_LOOKUPS_FIELD = BinaryField()
+
+# Encodes the already prepared (JSON-compatible) values when they are passed to PostgreSQL's jsonb
+_DB_JSON_ENCODER = msgspec.json.Encoder()
+
+# Outcomes of the default value checks, see `MsgspecSchemaField._check_default_value`
+_default_check_cache: dict[tuple, list[tuple[type[checks.CheckMessage], str, str | None, str]]] = {}
+
 
 class SchemaAttribute(DeferredAttribute):
     field: MsgspecSchemaField
@@ -88,9 +107,15 @@ class MsgspecSchemaField(JSONField, ty.Generic[types.ST]):
         *args,
         schema: type[types.ST] | te.Annotated[type[types.ST], ...] | BaseContainer | ty.ForwardRef | str | None = None,
         default: types.ST | ty.Callable[[], types.ST] | BaseExpression | None = NOT_PROVIDED,  # type: ignore[assignment]
+        format: StorageFormat = "json",
         **kwargs,
     ):
-        kwargs.setdefault("encoder", DjangoJSONEncoder)
+        if format not in STORAGE_FORMATS:
+            raise ValueError(f"The format must be one of {', '.join(STORAGE_FORMATS)}, got {format!r}.")
+        self.format = format
+        if format == "json":
+            # MessagePack columns never go through a JSON encoder, so none is forced (nor deconstructed)
+            kwargs.setdefault("encoder", DjangoJSONEncoder)
         if default is not NOT_PROVIDED:
             kwargs["default"] = default
         self.export_kwargs = export_kwargs = types.SchemaAdapter.extract_export_kwargs(kwargs)
@@ -98,19 +123,43 @@ class MsgspecSchemaField(JSONField, ty.Generic[types.ST]):
 
         self.schema = BaseContainer.unwrap(schema)
         self.adapter = types.SchemaAdapter(schema, None, self.get_attname(), self.null, **export_kwargs)
+        self._deconstruct_cache: tuple[tuple, ty.Any] | None = None
+        self._wrapped_schema: tuple[ty.Any, ty.Any] | None = None
+        self._transform_adapter_cache: dict[str, tuple[type, SchemaKeyTransformAdapter | None]] = {}
 
     def __copy__(self):
-        _, _, args, kwargs = self.deconstruct()
-        copied = self.__class__(*args, **kwargs)
-        copied.set_attributes_from_name(self.name)
+        # Django clones fields often (model inheritance, migration states), so the attributes are copied
+        # instead of re-running `__init__`. The adapter is re-bound by the copy, hence it is not shared.
+        copied = super().__copy__()
+        copied.adapter = copy.copy(self.adapter)
+        copied._transform_adapter_cache = {}
         return copied
 
     def deconstruct(self) -> ty.Any:
-        field_name, import_path, args, kwargs = super().deconstruct()
+        # The migration autodetector deconstructs the same field many times, so the result is cached.
+        # Callers are free to mutate the returned args and kwargs, hence the shallow copies.
+        cache_key = self._deconstruct_cache_key()
+        if self._deconstruct_cache is None or self._deconstruct_cache[0] != cache_key:
+            self._deconstruct_cache = (cache_key, self._deconstruct())
+        field_name, import_path, args, kwargs = self._deconstruct_cache[1]
+        return field_name, import_path, list(args), dict(kwargs)
+
+    def _deconstruct_cache_key(self) -> tuple:
+        return (
+            id(self.schema),
+            self.adapter.is_bound,
+            self.name,
+            self.null,
+            tuple(sorted(self.export_kwargs.items())),
+            # Compared by value, so reassigning any of these is picked up
+            self.default,
+            self.encoder,
+            self.decoder,
+            self.format,
+        )
 
-        # Normalize the import path
-        if import_path.startswith("django_msgspec_field."):
-            import_path = import_path.replace("django_msgspec_field.", "django_msgspec_field.", 1)
+    def _deconstruct(self) -> ty.Any:
+        field_name, import_path, args, kwargs = super().deconstruct()
 
         default = kwargs.get("default", NOT_PROVIDED)
         if default is not NOT_PROVIDED and not callable(default):
@@ -123,11 +172,17 @@ class MsgspecSchemaField(JSONField, ty.Generic[types.ST]):
                 schema = self.adapter.prepared_schema
             except types.ImproperlyConfiguredSchema:
                 pass
-        prep_schema = GenericContainer.wrap(schema)
-        kwargs.update(schema=prep_schema, **self.export_kwargs)
+        kwargs.update(schema=self._wrap_schema(schema), **self.export_kwargs)
+        if self.format != "json":
+            kwargs["format"] = self.format
 
         return field_name, import_path, args, kwargs
 
+    def _wrap_schema(self, schema: ty.Any) -> ty.Any:
+        if self._wrapped_schema is None or self._wrapped_schema[0] is not schema:
+            self._wrapped_schema = (schema, GenericContainer.wrap(schema))
+        return self._wrapped_schema[1]
+
     @staticmethod
     def descriptor_class(field: MsgspecSchemaField) -> DeferredAttribute:
         if field.has_default():
@@ -135,6 +190,7 @@ class MsgspecSchemaField(JSONField, ty.Generic[types.ST]):
         return UninitializedSchemaAttribute(field)
 
     def contribute_to_class(self, cls: types.DjangoModelType, name: str, private_only: bool = False) -> None:
+        self._deconstruct_cache = None
         self.adapter.bind(cls, name)
         super().contribute_to_class(cls, name, private_only)
 
@@ -148,33 +204,74 @@ class MsgspecSchemaField(JSONField, ty.Generic[types.ST]):
             message = f"Cannot resolve the schema. Original error: \n{exc.args[0]}"
             performed_checks.append(checks.Error(message, obj=self, id="msgspec.E001"))
 
+        performed_checks.extend(self._check_default_value())
+        return performed_checks
+
+    def _check_default_value(self) -> list[checks.CheckMessage]:
+        # The default value round-trip is the costly part of the checks;
+        # its outcome only depends on the schema, the default and the export options.
+        cache_key = self._default_check_cache_key()
+        default_checks = _default_check_cache.get(cache_key) if cache_key is not None else None
+        if default_checks is None:
+            default_checks = self._run_default_value_checks()
+            if cache_key is not None:
+                _default_check_cache[cache_key] = default_checks
+
+        return [
+            message_cls(message, obj=self, hint=hint, id=check_id)
+            for message_cls, message, hint, check_id in default_checks
+        ]
+
+    def _default_check_cache_key(self) -> tuple | None:
+        enc_hook = conf.msgspec_field_settings.enc_hook
+        try:
+            has_default = self.has_default()
+            raw_default = super().get_default() if has_default else None
+            cache_key = (
+                self.adapter.prepared_schema,
+                has_default,
+                msgspec.json.encode(raw_default, enc_hook=enc_hook),
+                tuple(sorted((key, repr(value)) for key, value in self.export_kwargs.items())),
+                enc_hook,
+                conf.msgspec_field_settings.dec_hook,
+            )
+            hash(cache_key)
+        except (types.ImproperlyConfiguredSchema, msgspec.EncodeError, TypeError):
+            return None
+        return cache_key
+
+    def _run_default_value_checks(self) -> list[tuple[type[checks.CheckMessage], str, str | None, str]]:
+        default_checks: list[tuple[type[checks.CheckMessage], str, str | None, str]] = []
+        schema_default = prep_default = None
         try:
             # Test that the default value conforms to the schema.
+            # `get_default` already validates the value, so it only needs to be dumped afterwards.
             if self.has_default():
-                self.get_prep_value(self.get_default())
+                schema_default = self.get_default()
+                prep_default = self.adapter.dump_python(schema_default)
         except msgspec.ValidationError as exc:
+            schema_default = None
             message = f"Default value cannot be adapted to the schema. msgspec error: \n{exc!s}"
-            performed_checks.append(checks.Error(message, obj=self, id="msgspec.E002"))
+            default_checks.append((checks.Error, message, None, "msgspec.E002"))
 
         if {"include", "exclude"} & self.export_kwargs.keys():
             # Try to prepare the default value to test export ability against it.
-            schema_default = self.get_default()
             if schema_default is None:
                 # If the default value is not set, try to get the default value from the schema.
-                prep_value = self.adapter.get_default_value()
-                if prep_value is not None:
-                    schema_default = prep_value
+                schema_default = self.adapter.get_default_value()
+                if schema_default is not None:
+                    prep_default = self.adapter.dump_python(schema_default)
 
             if schema_default is not None:
                 try:
                     # Perform the full round-trip transformation to test the export ability.
-                    self.adapter.validate_python(self.get_prep_value(schema_default))
+                    self.adapter.validate_python(prep_default)
                 except msgspec.ValidationError as exc:
                     message = f"Export arguments may lead to data integrity problems. msgspec error: \n{exc!s}"
                     hint = "Please review `include` and `exclude` arguments."
-                    performed_checks.append(checks.Warning(message, obj=self, hint=hint, id="msgspec.W003"))
+                    default_checks.append((checks.Warning, message, hint, "msgspec.W003"))
 
-        return performed_checks
+        return default_checks
 
     def validate(self, value: ty.Any, model_instance: ty.Any) -> None:
         value = self.adapter.validate_python(value)
@@ -184,37 +281,104 @@ class MsgspecSchemaField(JSONField, ty.Generic[types.ST]):
         # Only try validate_json if value is a string/bytes
         if isinstance(value, (str, bytes)):
             try:
-                value = self.adapter.validate_json(value)
-                return value
-            except (ValueError, msgspec.DecodeError, msgspec.ValidationError):
+                return self.adapter.validate_json(value)
+            except _JSON_PARSE_ERRORS:
                 """This is an expected error, this step is required to parse serialized values."""
+        elif (value is None and self.adapter.allow_null) or self.adapter.is_schema_instance(value):
+            # Values assigned through the descriptor are usually typed already
+            return value
 
         try:
             return self.adapter.validate_python(value)
         except msgspec.ValidationError as exc:
             raise exceptions.ValidationError(str(exc), code="invalid") from exc
 
+    def get_internal_type(self) -> str:
+        if self.format == "msgpack":
+            return "BinaryField"
+        return super().get_internal_type()
+
+    def _check_supported(self, databases):
+        # Binary columns need no native JSON support from the backend
+        if self.format == "msgpack":
+            return []
+        return super()._check_supported(databases)
+
     def from_db_value(self, value, expression, connection):
         if value is None:
             return value
 
+        if self.format == "msgpack":
+            return self.adapter.validate_msgpack(value)
+
         # Some backends (SQLite at least) extract non-string values in their SQL datatypes.
         if isinstance(expression, KeyTransform):
             return super().from_db_value(value, expression, connection)
 
         try:
             return self.adapter.validate_json(value)
-        except (ValueError, msgspec.DecodeError, msgspec.ValidationError):
+        except _JSON_PARSE_ERRORS:
             return super().from_db_value(value, expression, connection)
 
     def get_prep_value(self, value: ty.Any):
         value = self._prepare_raw_value(value)
         return super().get_prep_value(value)
 
+    def get_db_prep_value(self, value: ty.Any, connection, prepared: bool = False):
+        if self.format == "msgpack":
+            return self._get_db_prep_msgpack_value(value, connection)
+
+        # jsonb normalizes the stored document, so the text produced by msgspec is indistinguishable from `json.dumps`.
+        # Text-based backends compare the raw JSON in lookups and keep the stdlib formatting.
+        if (
+            connection.vendor != "postgresql"
+            or self.encoder is not DjangoJSONEncoder
+            or not hasattr(connection.ops, "adapt_json_value")
+        ):
+            return super().get_db_prep_value(value, connection, prepared)
+
+        if not prepared:
+            value = self.get_prep_value(value)
+        if isinstance(value, BaseExpression):
+            return super().get_db_prep_value(value, connection, prepared=True)
+
+        from django.db.backends.postgresql.psycopg_any import Jsonb
+
+        return Jsonb(value, dumps=_dumps_db_json)
+
+    def _get_db_prep_msgpack_value(self, value: ty.Any, connection):
+        if isinstance(value, BaseExpression):
+            return value
+        # Lookup values arrive already dumped to builtins. They are coerced back to the schema,
+        # so they are encoded exactly like the stored values (e.g. bytes are not base64 strings).
+        try:
+            if not self.adapter.is_schema_instance(value):
+                value = self.adapter.validate_python(value)
+        except _PREP_IGNORED_ERRORS:
+            """Same as in `_prepare_raw_value`, the value is stored as is."""
+        return connection.Database.Binary(self.adapter.dump_msgpack(value))
+
+    def get_lookup(self, lookup_name: str):
+        if self.format == "msgpack":
+            return _BINARY_LOOKUPS_FIELD.get_lookup(lookup_name)
+        return super().get_lookup(lookup_name)
+
     def get_transform(self, lookup_name: str):
+        if self.format == "msgpack":
+            return None
+
+        # JSONField builds a key transform for any unregistered name, only registered lookups are cached
+        # to keep the cache bounded. The registered class is kept to notice re-registrations.
+        registered = self.get_lookups().get(lookup_name)
+        cached = self._transform_adapter_cache.get(lookup_name)
+        if registered is not None and cached is not None and cached[0] is registered:
+            return cached[1]
+
         transform: ty.Any = super().get_transform(lookup_name)
         if transform is not None:
             transform = SchemaKeyTransformAdapter(transform)
+        if registered is not None:
+            self._transform_adapter_cache[lookup_name] = (registered, transform)
         return transform
 
     def get_default(self) -> ty.Any:
@@ -244,8 +408,11 @@ class MsgspecSchemaField(JSONField, ty.Generic[types.ST]):
         elif not isinstance(value, BaseExpression):
             # Prepare the value if it is not a query expression.
             try:
-                value = self.adapter.validate_python(value)
-            except (msgspec.ValidationError, types.ImproperlyConfiguredSchema):
+                # Values which are already schema instances (e.g. assigned through the descriptor)
+                # do not need another validation pass.
+                if not self.adapter.is_schema_instance(value):
+                    value = self.adapter.validate_python(value)
+            except _PREP_IGNORED_ERRORS:
                 """This is a legitimate situation, the data could not be initially coerced
                 or the adapter is not yet bound (e.g., during migration generation)."""
             value = self.adapter.dump_python(value, **dump_kwargs)
@@ -253,6 +420,25 @@ class MsgspecSchemaField(JSONField, ty.Generic[types.ST]):
         return value
 
 
+def _dumps_db_json(value: ty.Any) -> str:
+    encoded = _DB_JSON_ENCODER.encode(value)
+    # msgspec writes non-finite floats as `null`; jsonb cannot store them either, so they are rejected
+    # like `json.dumps(..., allow_nan=False)` does, instead of being silently replaced.
+    if b"null" in encoded and _has_non_finite_float(value):
+        raise ValueError("Out of range float values are not JSON compliant")
+    return encoded.decode()
+
+
+def _has_non_finite_float(value: ty.Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(map(_has_non_finite_float, value.values()))
+    if isinstance(value, (list, tuple)):
+        return any(map(_has_non_finite_float, value))
+    return False
+
+
 class SchemaKeyTransformAdapter:
     """An adapter for creating key transforms for schema field lookups."""
 
@@ -320,6 +506,8 @@ def SchemaField(schema=None, default=NOT_PROVIDED, *args, **kwargs):  # type: ig
         schema: The msgspec type to validate against. Can be a Struct, dataclass,
                 or any type supported by msgspec.
         default: Default value for the field.
+        format: Storage format of the column, either "json" (default) or "msgpack".
+                MessagePack values are stored in a binary column and support no JSON key lookups.
         **kwargs: Additional field options passed to JSONField.
 
     Returns:
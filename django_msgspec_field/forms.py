@@ -56,6 +56,9 @@ class SchemaField(JSONField, ty.Generic[types.ST]):
 
     def bound_data(self, data: ty.Any, initial: ty.Any):
         if self.disabled:
+            # Disabled fields render the stored value, which is usually typed already
+            if self.adapter.is_schema_instance(initial):
+                return initial
             return self.adapter.validate_python(initial)
         if data is None:
             return None
@@ -103,15 +106,41 @@ class SchemaField(JSONField, ty.Generic[types.ST]):
             return True
 
     def _try_coerce(self, value):
-        if not isinstance(value, (str, bytes)):
-            # The form data may contain python objects for some cases
-            value = self.adapter.validate_python(value)
-        elif not isinstance(value, JSONString):
-            # Otherwise, try to parse incoming JSON according to the schema.
-            value = self.adapter.validate_json(value)
-
+        handler = _COERCE_DISPATCH.get(type(value))
+        if handler is None:
+            # Subclasses of the dispatched types are rare, resolve them the slow way
+            if isinstance(value, JSONString):
+                handler = _coerce_identity
+            elif isinstance(value, (str, bytes)):
+                handler = _coerce_from_json
+            else:
+                handler = _coerce_from_python
+        return handler(self.adapter, value)
+
+
+def _coerce_from_python(adapter: types.SchemaAdapter[types.ST], value: ty.Any) -> ty.Any:
+    # The form data may contain python objects for some cases, schema instances need no validation
+    if adapter.is_schema_instance(value):
         return value
+    return adapter.validate_python(value)
+
+
+def _coerce_from_json(adapter: types.SchemaAdapter[types.ST], value: str | bytes) -> ty.Any:
+    # Otherwise, try to parse incoming JSON according to the schema.
+    return adapter.validate_json(value)
+
+
+def _coerce_identity(adapter: types.SchemaAdapter[types.ST], value: JSONString) -> JSONString:
+    return value
+
 
+_COERCE_DISPATCH: dict[type, ty.Callable[[types.SchemaAdapter[ty.Any], ty.Any], ty.Any]] = {
+    str: _coerce_from_json,
+    bytes: _coerce_from_json,
+    JSONString: _coerce_identity,
+    dict: _coerce_from_python,
+    list: _coerce_from_python,
+}
 
 try:
     from django_jsonform.widgets import JSONFormWidget as _JSONFormWidget  # type: ignore[import-untyped]
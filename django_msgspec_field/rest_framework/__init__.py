@@ -2,13 +2,18 @@
 Django REST Framework integration for msgspec schemas.
 """
 
-from . import coreapi as coreapi
-from . import openapi as openapi
+import importlib
+import typing as ty
+
 from .fields import SchemaField as SchemaField
-from .openapi import AutoSchema as AutoSchema
 from .parsers import SchemaParser as SchemaParser
 from .renderers import SchemaRenderer as SchemaRenderer
 
+if ty.TYPE_CHECKING:
+    from . import coreapi as coreapi
+    from . import openapi as openapi
+    from .openapi import AutoSchema as AutoSchema
+
 __all__ = (
     "AutoSchema",
     "SchemaField",
@@ -17,3 +22,26 @@ __all__ = (
     "coreapi",
     "openapi",
 )
+
+# Schema generation modules pull in DRF's schema and test machinery, so they are loaded on first access.
+_LAZY_ATTRIBUTES = {
+    "AutoSchema": ("openapi", "AutoSchema"),
+    "coreapi": ("coreapi", None),
+    "openapi": ("openapi", None),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"Module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    if attr_name is None:
+        return module
+    return getattr(module, attr_name)
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -47,6 +47,8 @@ class SchemaField(fields.Field, ty.Generic[types.ST]):
         try:
             if isinstance(data, (str, bytes)):
                 return self.adapter.validate_json(data)
+            if self.adapter.is_schema_instance(data):
+                return data
             return self.adapter.validate_python(data)
         except msgspec.ValidationError as exc:
             raise exceptions.ValidationError(str(exc), code="invalid")
@@ -55,7 +57,8 @@ class SchemaField(fields.Field, ty.Generic[types.ST]):
 
     def to_representation(self, value: types.ST | None):
         try:
-            prep_value = self.adapter.validate_python(value)
+            # Values are typically schema instances already, which do not need another validation pass
+            prep_value = value if self.adapter.is_schema_instance(value) else self.adapter.validate_python(value)
             return self.adapter.dump_python(prep_value)
         except msgspec.ValidationError as exc:
             raise exceptions.ValidationError(str(exc), code="invalid")
@@ -7,6 +7,7 @@ from __future__ import annotations
 import typing as ty
 
 import msgspec
+from django.conf import settings
 from rest_framework import exceptions, parsers
 
 from django_msgspec_field import types
@@ -29,9 +30,21 @@ class SchemaParser(mixins.AnnotatedAdapterMixin[types.ST], parsers.JSONParser):
         if adapter is None:
             raise RuntimeError("Schema should be either explicitly set with annotation or passed in the context")
 
+        decode = adapter._decoder.decode
+        body = self._read_body(stream)
         try:
-            return adapter.validate_json(stream.read())
-        except msgspec.ValidationError as exc:
-            raise exceptions.ParseError(str(exc))
-        except msgspec.DecodeError as exc:
+            return decode(body)
+        except (msgspec.ValidationError, msgspec.DecodeError) as exc:
             raise exceptions.ParseError(str(exc))
+
+    @staticmethod
+    def _read_body(stream: ty.IO[bytes]) -> bytes:
+        # Reading from the raw request stream bypasses Django's own body size check, so enforce it here
+        max_size = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        if max_size is None:
+            return stream.read()
+
+        body = stream.read(max_size + 1)
+        if len(body) > max_size:
+            raise exceptions.ParseError("Request body exceeded settings.DATA_UPLOAD_MAX_MEMORY_SIZE.")
+        return body
@@ -20,6 +20,14 @@ if ty.TYPE_CHECKING:
 
 __all__ = ("SchemaRenderer",)
 
+_DEFAULT_ENCODER = msgspec.json.Encoder()
+
+
+class _RenderError(msgspec.Struct):
+    """Payload rendered when the response data does not match the schema."""
+
+    error: str
+
 
 class SchemaRenderer(mixins.AnnotatedAdapterMixin[types.ST], renderers.JSONRenderer):
     """
@@ -41,12 +49,16 @@ class SchemaRenderer(mixins.AnnotatedAdapterMixin[types.ST], renderers.JSONRende
         if adapter is None:
             raise RuntimeError("Schema should be either explicitly set with annotation or passed in the context")
 
+        if adapter.is_schema_instance(data):
+            # Well-typed views return schema instances, which are encoded without another validation pass
+            return adapter.dump_json(data)
+
         try:
             prep_data = adapter.validate_python(data)
             return adapter.dump_json(prep_data)
         except msgspec.ValidationError as exc:
-            return msgspec.json.encode({"error": str(exc)})
+            return _DEFAULT_ENCODER.encode(_RenderError(str(exc)))
 
     def render_msgspec_struct(self, instance: msgspec.Struct, renderer_context: Mapping[str, ty.Any]):
         """Render a msgspec Struct directly."""
-        return msgspec.json.encode(instance)
+        return _DEFAULT_ENCODER.encode(instance)
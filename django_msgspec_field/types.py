@@ -4,23 +4,28 @@ Core types and schema adapter for msgspec integration with Django.
 
 from __future__ import annotations
 
+import dataclasses
+import functools
+import operator
 import sys
 import typing as ty
-from collections import ChainMap
 
 import msgspec
 import typing_extensions as te
 
-from .compat.django import BaseContainer, GenericContainer
+from .compat.django import BaseContainer, GenericContainer, UnionType
 from .compat.functools import cached_property
 from .conf import msgspec_field_settings
 
 if ty.TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
+    from types import ModuleType
 
     from django.db.models import Model
 
     DjangoModelType = type[Model]
+    # Either `msgspec.json` or `msgspec.msgpack`
+    _Protocol = ModuleType
     SchemaT = ty.Union[
         msgspec.Struct,
         Sequence[ty.Any],
@@ -49,6 +54,9 @@ class ExportKwargs(te.TypedDict, total=False):
     exclude_unset: bool
 
 
+_EXPORT_KWARG_KEYS = frozenset(ExportKwargs.__annotations__)
+
+
 class ImproperlyConfiguredSchema(ValueError):
     """Raised when the schema is improperly configured."""
 
@@ -96,7 +104,7 @@ class SchemaAdapter(ty.Generic[ST]):
     def extract_export_kwargs(kwargs: dict[str, ty.Any]) -> ExportKwargs:
         """Extract the export kwargs from the kwargs passed to the field.
         This method mutates passed kwargs by removing those that are used by the adapter."""
-        common_keys = kwargs.keys() & ExportKwargs.__annotations__.keys()
+        common_keys = kwargs.keys() & _EXPORT_KWARG_KEYS
         export_kwargs = {key: kwargs.pop(key) for key in common_keys}
         return ty.cast(ExportKwargs, export_kwargs)
 
@@ -106,7 +114,7 @@ class SchemaAdapter(ty.Generic[ST]):
         enc_hook = self.export_kwargs.get("enc_hook")
         if enc_hook is None:
             enc_hook = msgspec_field_settings.enc_hook
-        return msgspec.json.Encoder(enc_hook=enc_hook)
+        return _get_encoder(msgspec.json, enc_hook)
 
     @cached_property
     def _decoder(self) -> msgspec.json.Decoder:
@@ -115,7 +123,33 @@ class SchemaAdapter(ty.Generic[ST]):
         if dec_hook is None:
             dec_hook = msgspec_field_settings.dec_hook
         strict = self.export_kwargs.get("strict", False)
-        return msgspec.json.Decoder(self.prepared_schema, dec_hook=dec_hook, strict=strict)
+        return _get_decoder(msgspec.json, self.prepared_schema, dec_hook, strict)
+
+    @cached_property
+    def _msgpack_encoder(self) -> msgspec.msgpack.Encoder:
+        """Create a msgspec MessagePack encoder."""
+        enc_hook = self.export_kwargs.get("enc_hook")
+        if enc_hook is None:
+            enc_hook = msgspec_field_settings.enc_hook
+        return _get_encoder(msgspec.msgpack, enc_hook)
+
+    @cached_property
+    def _msgpack_decoder(self) -> msgspec.msgpack.Decoder:
+        """Create a msgspec MessagePack decoder for the prepared schema."""
+        dec_hook = self.export_kwargs.get("dec_hook")
+        if dec_hook is None:
+            dec_hook = msgspec_field_settings.dec_hook
+        strict = self.export_kwargs.get("strict", False)
+        return _get_decoder(msgspec.msgpack, self.prepared_schema, dec_hook, strict)
+
+    @cached_property
+    def _converter(self) -> ty.Callable[[ty.Any], ST]:
+        """Create a `msgspec.convert` callable specialized for the prepared schema and export kwargs."""
+        dec_hook = self.export_kwargs.get("dec_hook")
+        if dec_hook is None:
+            dec_hook = msgspec_field_settings.dec_hook
+        strict = self.export_kwargs.get("strict", False)
+        return functools.partial(msgspec.convert, type=self.prepared_schema, dec_hook=dec_hook, strict=strict)
 
     @property
     def is_bound(self) -> bool:
@@ -127,8 +161,14 @@ class SchemaAdapter(ty.Generic[ST]):
         self.parent_type = parent_type
         self.attname = attname
         self.__dict__.pop("prepared_schema", None)
+        self.__dict__.pop("_schema_types", None)
+        self.__dict__.pop("_is_struct", None)
+        self.__dict__.pop("_identity", None)
         self.__dict__.pop("_decoder", None)
         self.__dict__.pop("_encoder", None)
+        self.__dict__.pop("_msgpack_decoder", None)
+        self.__dict__.pop("_msgpack_encoder", None)
+        self.__dict__.pop("_converter", None)
         return self
 
     def validate_schema(self) -> None:
@@ -140,26 +180,26 @@ class SchemaAdapter(ty.Generic[ST]):
                 raise ImproperlyConfiguredSchema(*exc.args) from exc
             raise
 
+    def is_schema_instance(self, value: ty.Any) -> bool:
+        """Return True if the value is exactly of the Struct or dataclass schema type (or union member type)."""
+        return type(value) in self._schema_types
+
     def validate_python(self, value: ty.Any, *, strict: bool | None = None) -> ST:
         """Validate a Python value against the schema."""
         if value is None and self.allow_null:
             return value  # type: ignore
 
-        # Use msgspec.convert for Python object validation
+        if strict is None:
+            return self._converter(value)
+
         dec_hook = self.export_kwargs.get("dec_hook")
         if dec_hook is None:
             dec_hook = msgspec_field_settings.dec_hook
-        if strict is None:
-            strict = self.export_kwargs.get("strict", False)
-        try:
-            return msgspec.convert(value, self.prepared_schema, dec_hook=dec_hook, strict=strict)
-        except msgspec.ValidationError:
-            raise
+        return msgspec.convert(value, self.prepared_schema, dec_hook=dec_hook, strict=strict)
 
     def validate_json(self, value: str | bytes, *, strict: bool | None = None) -> ST:
         """Validate a JSON string/bytes against the schema."""
-        if isinstance(value, str):
-            value = value.encode("utf-8")
+        # msgspec decodes `str` input directly, no need to encode it to bytes first
         try:
             return self._decoder.decode(value)
         except msgspec.DecodeError:
@@ -167,29 +207,39 @@ class SchemaAdapter(ty.Generic[ST]):
         except msgspec.ValidationError:  # type: ignore
             raise
 
+    def validate_msgpack(self, value: bytes | memoryview) -> ST:
+        """Validate MessagePack data against the schema."""
+        return self._msgpack_decoder.decode(value)
+
     def dump_python(self, value: ty.Any, **override_kwargs) -> ty.Any:
         """Dump the value to a JSON-compatible Python object."""
         if value is None:
             return None
 
-        # Apply field filtering if configured
         enc_hook = self.export_kwargs.get("enc_hook")
         if enc_hook is None:
             enc_hook = msgspec_field_settings.enc_hook
-        result = msgspec.to_builtins(value, enc_hook=enc_hook)
 
-        # Apply include/exclude filters
-        # Use sentinel to distinguish between "not passed" and "explicitly set to None"
-        _unset = object()
-        include = override_kwargs.get("include", _unset)
-        if include is _unset:
-            include = self.export_kwargs.get("include")
-        exclude = override_kwargs.get("exclude", _unset)
-        if exclude is _unset:
-            exclude = self.export_kwargs.get("exclude")
-        exclude_none = override_kwargs.get("exclude_none", self.export_kwargs.get("exclude_none", False))
-        exclude_defaults = override_kwargs.get("exclude_defaults", self.export_kwargs.get("exclude_defaults", False))
+        include, exclude, exclude_none, exclude_defaults = self._get_export_filters(override_kwargs)
+        if not (include or exclude or exclude_none or exclude_defaults):
+            return msgspec.to_builtins(value, enc_hook=enc_hook)
+
+        if isinstance(value, msgspec.Struct):
+            projected = _project_struct(value, include, exclude, exclude_none, exclude_defaults)
+            if projected is not None:
+                return msgspec.to_builtins(projected, enc_hook=enc_hook)
+
+            # Filter struct fields before conversion, so excluded subtrees are never converted
+            export_fields = _get_struct_export_fields(
+                type(value),
+                frozenset(include) if include else None,
+                frozenset(exclude) if exclude else None,
+            )
+            if export_fields is not None:
+                data = _export_struct_fields(value, export_fields, exclude_none, exclude_defaults)
+                return msgspec.to_builtins(data, enc_hook=enc_hook)
 
+        result = msgspec.to_builtins(value, enc_hook=enc_hook)
         if isinstance(result, dict):
             result = self._filter_dict(result, include, exclude, exclude_none, exclude_defaults, value)
 
@@ -200,9 +250,41 @@ class SchemaAdapter(ty.Generic[ST]):
         if value is None:
             return b"null"
 
-        # First convert to a filtered dict if needed
-        python_value = self.dump_python(value, **override_kwargs)
-        return msgspec.json.encode(python_value)
+        return self._encoder.encode(self._prepare_export(value, override_kwargs))
+
+    def dump_msgpack(self, value: ty.Any, **override_kwargs) -> bytes:
+        """Dump the value to MessagePack bytes."""
+        return self._msgpack_encoder.encode(self._prepare_export(value, override_kwargs))
+
+    def _prepare_export(self, value: ty.Any, override_kwargs: Mapping[str, ty.Any]) -> ty.Any:
+        """Return the object to hand to an encoder, with the export filters applied."""
+        # Without filters, encode straight away instead of going through `to_builtins` first
+        if value is None or not self._has_export_filters(override_kwargs):
+            return value
+
+        if isinstance(value, msgspec.Struct):
+            projected = _project_struct(value, *self._get_export_filters(override_kwargs))
+            if projected is not None:
+                return projected
+
+        # Otherwise, convert to a filtered dict first
+        return self.dump_python(value, **override_kwargs)
+
+    def _get_export_filters(self, override_kwargs: Mapping[str, ty.Any]) -> tuple[ty.Any, ty.Any, bool, bool]:
+        """Return the `include`, `exclude`, `exclude_none` and `exclude_defaults` values in effect."""
+        export_kwargs = self.export_kwargs
+        # Explicitly passed `None` overrides the adapter's value, hence the membership checks
+        include = override_kwargs["include"] if "include" in override_kwargs else export_kwargs.get("include")
+        exclude = override_kwargs["exclude"] if "exclude" in override_kwargs else export_kwargs.get("exclude")
+        exclude_none = override_kwargs.get("exclude_none", export_kwargs.get("exclude_none", False))
+        exclude_defaults = override_kwargs.get("exclude_defaults", export_kwargs.get("exclude_defaults", False))
+        return include, exclude, exclude_none, exclude_defaults
+
+    def _has_export_filters(self, override_kwargs: Mapping[str, ty.Any]) -> bool:
+        return any(
+            override_kwargs.get(key, self.export_kwargs.get(key))
+            for key in ("include", "exclude", "exclude_none", "exclude_defaults")
+        )
 
     def json_schema(self) -> dict[str, ty.Any]:
         """Return the JSON schema for the field."""
@@ -210,11 +292,10 @@ class SchemaAdapter(ty.Generic[ST]):
 
     def get_default_value(self) -> ST | None:
         """Get the default value for the schema if available."""
-        schema = self.prepared_schema
-        if hasattr(schema, "__struct_defaults__"):
+        if self._is_struct:
             # For Struct types, we can try to instantiate with defaults
             try:
-                return schema()  # type: ignore
+                return self.prepared_schema()  # type: ignore
             except TypeError:
                 return None
         return None
@@ -240,13 +321,32 @@ class SchemaAdapter(ty.Generic[ST]):
                 error_msg = "Cannot resolve the schema. The adapter is accessed before it was bound."
             raise ImproperlyConfiguredSchema(error_msg)
 
-        if self.allow_null:
+        if self.allow_null and not _is_nullable_union(schema):
             schema = ty.Optional[schema]  # type: ignore
 
         return ty.cast(type[ST], schema)
 
     prepared_schema = cached_property(_prepare_schema)
 
+    @cached_property
+    def _is_struct(self) -> bool:
+        """Whether the prepared schema itself is a msgspec Struct class."""
+        schema = self.prepared_schema
+        return issubclass(type(schema), type) and issubclass(schema, msgspec.Struct)
+
+    @cached_property
+    def _schema_types(self) -> tuple[type, ...]:
+        """The Struct and dataclass types the prepared schema resolves to, union members included.
+
+        `msgspec.convert` returns instances of exactly these types unchanged, so they need no validation pass.
+        Instances of their subclasses are rejected by `msgspec.convert`, hence the exact type match in
+        `is_schema_instance`. Other classes are left out: scalar types coerce or reject their subclasses
+        (e.g. `bool` for `int`), and some (TypedDict, `typing.Any`) are not classes at all.
+        """
+        schema = self.prepared_schema
+        members = ty.get_args(schema) if isinstance(schema, UnionType) else (schema,)
+        return tuple(member for member in members if _is_passthrough_type(member))
+
     def __copy__(self):
         instance = self.__class__(
             self.schema,
@@ -261,42 +361,50 @@ class SchemaAdapter(ty.Generic[ST]):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(bound={self.is_bound}, schema={self.schema!r})"
 
+    @cached_property
+    def _identity(self) -> tuple[ty.Any, ...]:
+        """The values compared by `__eq__`, computed once per binding.
+
+        Raises `ImproperlyConfiguredSchema` (and caches nothing) while the schema cannot be resolved.
+        """
+        return (self.attname, self.prepared_schema, self.export_kwargs)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
 
-        self_fields: list[ty.Any] = [self.attname, self.export_kwargs]
-        other_fields: list[ty.Any] = [other.attname, other.export_kwargs]
         try:
-            self_fields.append(self.prepared_schema)
-            other_fields.append(other.prepared_schema)
+            return self._identity == other._identity
         except ImproperlyConfiguredSchema:
             if self.is_bound and other.is_bound:
                 return False
-            else:
-                self_fields.extend((self.schema, self.allow_null))
-                other_fields.extend((other.schema, other.allow_null))
 
+        self_fields = (self.attname, self.export_kwargs, self.schema, self.allow_null)
+        other_fields = (other.attname, other.export_kwargs, other.schema, other.allow_null)
         return self_fields == other_fields
 
     def _guess_schema_from_annotations(self) -> type[ST] | str | ty.ForwardRef | None:
         return get_annotated_type(self.parent_type, self.attname)
 
-    def _resolve_schema_forward_ref(self, schema: ty.Any) -> ty.Any:
+    def _resolve_schema_forward_ref(self, schema: ty.Any, namespace: dict[str, ty.Any] | None = None) -> ty.Any:
         if schema is None:
             return None
 
         if isinstance(schema, ty.ForwardRef):
-            globalns = get_namespace(self.parent_type)
-            return evaluate_forward_ref(schema, globalns)
+            if namespace is None:
+                namespace = get_namespace(self.parent_type)
+            return evaluate_forward_ref(schema, namespace)
 
         wrapped_schema = GenericContainer.wrap(schema)
         if not isinstance(wrapped_schema, GenericContainer):
             return schema
 
-        origin = self._resolve_schema_forward_ref(wrapped_schema.origin)
-        args = map(self._resolve_schema_forward_ref, wrapped_schema.args)
-        return GenericContainer.unwrap(GenericContainer(origin, tuple(args)))
+        # Merge the namespace once for the whole schema tree rather than per nested forward reference
+        if namespace is None:
+            namespace = get_namespace(self.parent_type)
+        origin = self._resolve_schema_forward_ref(wrapped_schema.origin, namespace)
+        args = tuple(self._resolve_schema_forward_ref(arg, namespace) for arg in wrapped_schema.args)
+        return GenericContainer.unwrap(GenericContainer(origin, args))
 
     def _filter_dict(
         self,
@@ -307,30 +415,212 @@ class SchemaAdapter(ty.Generic[ST]):
         exclude_defaults: bool,
         original_value: ty.Any,
     ) -> dict:
-        """Apply include/exclude filters to a dictionary."""
-        result = {}
+        """Apply include/exclude filters to a dictionary.
+
+        The dictionary is freshly built by `msgspec.to_builtins`, so it is filtered in place.
+        Key filters are applied with set operations instead of a Python-level scan of every key.
+        """
+        # Skip excluded keys
+        if exclude:
+            for key in data.keys() & exclude:
+                del data[key]
+        # Only include specified keys
+        if include:
+            for key in data.keys() - include:
+                del data[key]
+
+        if not (exclude_none or exclude_defaults):
+            return data
 
         # Get defaults from struct if available
         defaults = {}
-        if exclude_defaults and hasattr(original_value, "__struct_defaults__"):
-            defaults = original_value.__struct_defaults__
-
-        for key, value in data.items():
-            # Skip excluded keys
-            if exclude and key in exclude:
-                continue
-            # Only include specified keys
-            if include and key not in include:
-                continue
-            # Skip None values if configured
-            if exclude_none and value is None:
-                continue
-            # Skip default values if configured
-            if exclude_defaults and key in defaults and value == defaults[key]:
-                continue
-            result[key] = value
+        if exclude_defaults and isinstance(original_value, msgspec.Struct):
+            defaults = _get_struct_encoded_defaults(type(original_value))
+
+        # Only the checks which are enabled are evaluated for each key
+        if not (exclude_defaults and defaults):
+            if not exclude_none:
+                return data
+            return {key: value for key, value in data.items() if value is not None}
+        if not exclude_none:
+            return {key: value for key, value in data.items() if not (key in defaults and value == defaults[key])}
+        return {
+            key: value
+            for key, value in data.items()
+            if value is not None and not (key in defaults and value == defaults[key])
+        }
+
+
+def _is_passthrough_type(schema: ty.Any) -> bool:
+    """Return True if the schema is a Struct or dataclass type."""
+    # `isinstance(list[int], type)` holds on Python 3.10, so check the metaclass instead
+    if not issubclass(type(schema), type):
+        return False
+    return issubclass(schema, msgspec.Struct) or dataclasses.is_dataclass(schema)
+
+
+def _is_nullable_union(schema: ty.Any) -> bool:
+    """Return True if the schema is a union that already admits None."""
+    return isinstance(schema, UnionType) and type(None) in ty.get_args(schema)
+
+
+def _get_encoder(protocol: _Protocol, enc_hook: ty.Callable[[ty.Any], ty.Any] | None) -> ty.Any:
+    """Get an encoder of the `msgspec.json` or `msgspec.msgpack` protocol shared by all adapters using the same hook."""
+    try:
+        return _get_cached_encoder(protocol, enc_hook)
+    except TypeError:
+        # Unhashable hook
+        return protocol.Encoder(enc_hook=enc_hook)
+
+
+def _get_decoder(
+    protocol: _Protocol,
+    schema: ty.Any,
+    dec_hook: ty.Callable[[type, ty.Any], ty.Any] | None,
+    strict: bool,
+) -> ty.Any:
+    """Get a decoder of the given protocol shared by all adapters with the same schema and decoding options."""
+    try:
+        hash((schema, dec_hook, strict))
+    except TypeError:
+        # msgspec raises TypeError for unsupported schemas too, so hashability is checked beforehand
+        return protocol.Decoder(schema, dec_hook=dec_hook, strict=strict)
+    return _get_cached_decoder(protocol, schema, dec_hook, strict)
 
-        return result
+
+@functools.lru_cache(maxsize=64)
+def _get_cached_encoder(protocol: _Protocol, enc_hook: ty.Callable[[ty.Any], ty.Any] | None) -> ty.Any:
+    return protocol.Encoder(enc_hook=enc_hook)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_cached_decoder(
+    protocol: _Protocol,
+    schema: ty.Any,
+    dec_hook: ty.Callable[[type, ty.Any], ty.Any] | None,
+    strict: bool,
+) -> ty.Any:
+    return protocol.Decoder(schema, dec_hook=dec_hook, strict=strict)
+
+
+_StructExportFields = tuple[tuple[str, str, ty.Any], ...]
+_StructFactory = msgspec._core.Factory  # type: ignore[attr-defined]
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_struct_encoded_defaults(struct_type: type[msgspec.Struct]) -> dict[str, ty.Any]:
+    """Return the struct field defaults keyed by their encoded names; default factories are evaluated once."""
+    defaults = struct_type.__struct_defaults__
+    if not defaults:
+        return {}
+    encoded_names = struct_type.__struct_encode_fields__[-len(defaults) :]
+    return {
+        name: default.factory() if isinstance(default, _StructFactory) else default
+        for name, default in zip(encoded_names, defaults)
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_struct_export_fields(
+    struct_type: type[msgspec.Struct],
+    include: frozenset[str] | None,
+    exclude: frozenset[str] | None,
+) -> _StructExportFields | None:
+    """Return the `(name, encoded name, default)` triples to export for a struct type.
+
+    Returns None for struct layouts which are not encoded as a plain mapping of their fields
+    (array-like, tagged or default-omitting structs); those are filtered after conversion instead.
+    """
+    config = struct_type.__struct_config__
+    if config.array_like or config.tag is not None or config.omit_defaults:
+        return None
+
+    names = struct_type.__struct_fields__
+    defaults = struct_type.__struct_defaults__
+    # Defaults are aligned with the trailing fields; default factories are evaluated once for comparison
+    padded_defaults = (msgspec.NODEFAULT,) * (len(names) - len(defaults)) + tuple(
+        default.factory() if isinstance(default, _StructFactory) else default for default in defaults
+    )
+
+    export_fields = []
+    for name, encoded_name, default in zip(names, struct_type.__struct_encode_fields__, padded_defaults):
+        if exclude and encoded_name in exclude:
+            continue
+        if include and encoded_name not in include:
+            continue
+        export_fields.append((name, encoded_name, default))
+    return tuple(export_fields)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_struct_projection(
+    struct_type: type[msgspec.Struct],
+    include: frozenset[str] | None,
+    exclude: frozenset[str] | None,
+) -> ty.Callable[[msgspec.Struct], msgspec.Struct] | None:
+    """Return a callable copying the exported fields of a struct into a struct type made of only those fields.
+
+    The projection is encoded by msgspec directly, without filtering anything per value.
+    Returns None for the struct layouts `_get_struct_export_fields` does not support.
+    """
+    export_fields = _get_struct_export_fields(struct_type, include, exclude)
+    if export_fields is None:
+        return None
+
+    names = tuple(name for name, _, _ in export_fields)
+    projection = msgspec.defstruct(
+        f"{struct_type.__name__}Projection",
+        [(name, ty.Any) for name in names],
+        rename={name: encoded_name for name, encoded_name, _ in export_fields},
+        module=struct_type.__module__,
+    )
+    if not names:
+        return lambda value: projection()
+
+    getter = operator.attrgetter(*names)
+    if len(names) == 1:
+        return lambda value: projection(getter(value))
+    return lambda value: projection(*getter(value))
+
+
+def _project_struct(
+    value: msgspec.Struct,
+    include: ty.Any,
+    exclude: ty.Any,
+    exclude_none: bool,
+    exclude_defaults: bool,
+) -> msgspec.Struct | None:
+    """Project the struct onto its `include`/`exclude` selected fields, or return None if it cannot be projected."""
+    # Value-dependent filters cannot be baked into the projected type
+    if exclude_none or exclude_defaults:
+        return None
+    project = _get_struct_projection(
+        type(value),
+        frozenset(include) if include else None,
+        frozenset(exclude) if exclude else None,
+    )
+    if project is None:
+        return None
+    return project(value)
+
+
+def _export_struct_fields(
+    value: msgspec.Struct,
+    export_fields: _StructExportFields,
+    exclude_none: bool,
+    exclude_defaults: bool,
+) -> dict[str, ty.Any]:
+    data = {}
+    for name, encoded_name, default in export_fields:
+        field_value = getattr(value, name)
+        if field_value is msgspec.UNSET:
+            continue
+        if exclude_none and field_value is None:
+            continue
+        if exclude_defaults and default is not msgspec.NODEFAULT and field_value == default:
+            continue
+        data[encoded_name] = field_value
+    return data
 
 
 # Utility functions (moved from utils.py)
@@ -357,9 +647,9 @@ def get_annotated_type(obj, field, default=None) -> ty.Any:
         return default
 
 
-def get_namespace(cls) -> ChainMap[str, ty.Any]:
-    """Get the namespace for resolving forward references."""
-    return ChainMap(get_local_namespace(cls), get_global_namespace(cls))
+def get_namespace(cls) -> dict[str, ty.Any]:
+    """Get the namespace for resolving forward references, class attributes shadowing module globals."""
+    return {**get_global_namespace(cls), **get_local_namespace(cls)}
 
 
 def get_global_namespace(cls) -> dict[str, ty.Any]:
@@ -389,16 +679,18 @@ def get_origin_type(cls: type):
 
 def evaluate_forward_ref(ref: ty.ForwardRef, ns: ty.Mapping[str, ty.Any]) -> ty.Any:
     """Evaluate a forward reference in a namespace."""
+    globalns = ns if type(ns) is dict else dict(ns)
+
     # Python 3.14+ has typing.evaluate_forward_ref with keyword-only arguments
     eval_func = getattr(ty, "evaluate_forward_ref", None)
     if eval_func is not None:
-        return eval_func(ref, globals=dict(ns), locals={})
+        return eval_func(ref, globals=globalns, locals={})
 
     # Python 3.13+ has ForwardRef.evaluate method
     if hasattr(ref, "evaluate"):
-        return ref.evaluate(globals=dict(ns), locals={})  # type: ignore
+        return ref.evaluate(globals=globalns, locals={})  # type: ignore
 
     # Fallback for older Python versions
     if sys.version_info >= (3, 13):
-        return ref._evaluate(dict(ns), {}, type_params=(), recursive_guard=frozenset())
-    return ref._evaluate(dict(ns), {}, recursive_guard=frozenset())
+        return ref._evaluate(globalns, {}, type_params=(), recursive_guard=frozenset())
+    return ref._evaluate(globalns, {}, recursive_guard=frozenset())
@@ -1,3 +1,4 @@
+import functools
 import typing as t
 from datetime import date
 
@@ -79,3 +80,9 @@ def available_database_backends(request, settings):
 @pytest.fixture
 def snapshot_json(snapshot):
     return snapshot.use_extension(JSONSnapshotExtension)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_expression(source: str):
+    """Compile a serialized migration expression once, parametrized tests evaluate the same sources repeatedly."""
+    return compile(source, "<migration>", "eval")
@@ -8,6 +8,10 @@ import tests.sample_app.models
 import typing
 import typing_extensions
 
+# Shared by the fields below, neither the schema nor the default is ever mutated
+BUILDING_META_DEFAULT = {"type": "frame"}
+BUILDING_META_LIST = django_msgspec_field.compat.django.GenericContainer(list, (tests.sample_app.models.BuildingMeta,))
+
 
 class Migration(migrations.Migration):
     initial = True
@@ -22,7 +26,7 @@ class Migration(migrations.Migration):
                 (
                     "opt_meta",
                     django_msgspec_field.fields.MsgspecSchemaField(
-                        default={"type": "frame"},
+                        default=BUILDING_META_DEFAULT,
                         encoder=django.core.serializers.json.DjangoJSONEncoder,
                         exclude={"type"},
                         null=True,
@@ -38,7 +42,7 @@ class Migration(migrations.Migration):
                 (
                     "meta",
                     django_msgspec_field.fields.MsgspecSchemaField(
-                        default={"type": "frame"},
+                        default=BUILDING_META_DEFAULT,
                         encoder=django.core.serializers.json.DjangoJSONEncoder,
                         include={"type"},
                         schema=tests.sample_app.models.BuildingMeta,
@@ -49,9 +53,7 @@ class Migration(migrations.Migration):
                     django_msgspec_field.fields.MsgspecSchemaField(
                         default=list,
                         encoder=django.core.serializers.json.DjangoJSONEncoder,
-                        schema=django_msgspec_field.compat.django.GenericContainer(
-                            list, (tests.sample_app.models.BuildingMeta,)
-                        ),
+                        schema=BUILDING_META_LIST,
                     ),
                 ),
                 (
@@ -59,9 +61,7 @@ class Migration(migrations.Migration):
                     django_msgspec_field.fields.MsgspecSchemaField(
                         default=list,
                         encoder=django.core.serializers.json.DjangoJSONEncoder,
-                        schema=django_msgspec_field.compat.django.GenericContainer(
-                            list, (tests.sample_app.models.BuildingMeta,)
-                        ),
+                        schema=BUILDING_META_LIST,
                     ),
                 ),
                 (
@@ -85,7 +85,7 @@ class Migration(migrations.Migration):
                 (
                     "meta",
                     django_msgspec_field.fields.MsgspecSchemaField(
-                        default={"type": "frame"},
+                        default=BUILDING_META_DEFAULT,
                         encoder=django.core.serializers.json.DjangoJSONEncoder,
                         schema=tests.sample_app.models.BuildingMeta,
                     ),
@@ -95,9 +95,7 @@ class Migration(migrations.Migration):
                     django_msgspec_field.fields.MsgspecSchemaField(
                         default=list,
                         encoder=django.core.serializers.json.DjangoJSONEncoder,
-                        schema=django_msgspec_field.compat.django.GenericContainer(
-                            list, (tests.sample_app.models.BuildingMeta,)
-                        ),
+                        schema=BUILDING_META_LIST,
                     ),
                 ),
                 (
@@ -105,9 +103,7 @@ class Migration(migrations.Migration):
                     django_msgspec_field.fields.MsgspecSchemaField(
                         default=list,
                         encoder=django.core.serializers.json.DjangoJSONEncoder,
-                        schema=django_msgspec_field.compat.django.GenericContainer(
-                            list, (tests.sample_app.models.BuildingMeta,)
-                        ),
+                        schema=BUILDING_META_LIST,
                     ),
                 ),
                 (
@@ -13,7 +13,7 @@ class BuildingTypes(str, enum.Enum):
     STUCCO = "stucco"
 
 
-class BuildingMeta(msgspec.Struct):
+class BuildingMeta(msgspec.Struct, frozen=True, gc=False):
     """Building metadata schema."""
 
     type: t.Optional[BuildingTypes] = None
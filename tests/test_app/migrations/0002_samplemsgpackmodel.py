@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+import django_msgspec_field.compat.django
+import django_msgspec_field.fields
+import tests.conftest
+
+
+class Migration(migrations.Migration):
+    dependencies = [  # noqa: RUF012
+        ("test_app", "0001_initial"),
+    ]
+
+    operations = [  # noqa: RUF012
+        migrations.CreateModel(
+            name="SampleMsgpackModel",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "sample_field",
+                    django_msgspec_field.fields.MsgspecSchemaField(
+                        format="msgpack",
+                        schema=tests.conftest.InnerSchema,
+                    ),
+                ),
+                (
+                    "sample_list",
+                    django_msgspec_field.fields.MsgspecSchemaField(
+                        default=list,
+                        format="msgpack",
+                        schema=django_msgspec_field.compat.django.GenericContainer(list, (tests.conftest.InnerSchema,)),
+                    ),
+                ),
+            ],
+        ),
+    ]
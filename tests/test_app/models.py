@@ -25,6 +25,14 @@ class SampleModel(models.Model):
         app_label = "test_app"
 
 
+class SampleMsgpackModel(models.Model):
+    sample_field: InnerSchema = SchemaField(format="msgpack")
+    sample_list: t.List[InnerSchema] = SchemaField(format="msgpack", default=list)
+
+    class Meta:
+        app_label = "test_app"
+
+
 class SampleForwardRefModel(models.Model):
     annotated_field: "SampleSchema" = SchemaField(default=dict)
     field = SchemaField(schema=t.ForwardRef("SampleSchema"), default=dict)
@@ -33,13 +41,13 @@ class SampleForwardRefModel(models.Model):
         app_label = "test_app"
 
 
-class SampleSchema(msgspec.Struct):
+class SampleSchema(msgspec.Struct, frozen=True, gc=False):
     """Sample schema for testing."""
 
     field: int = 1
 
 
-class ExampleSchema(msgspec.Struct):
+class ExampleSchema(msgspec.Struct, frozen=True, gc=False):
     """Example schema for testing."""
 
     count: int
@@ -62,6 +62,31 @@ class TestMsgspecFieldSettings:
         assert settings.enc_hook is custom_enc_hook
         assert settings.dec_hook is custom_dec_hook
 
+    def test_settings_resolved_per_attribute(self):
+        """Test that each setting is resolved and cached on its own first access."""
+        user_settings = {
+            "ENC_HOOK": "tests.test_conf.custom_enc_hook",
+            "DEC_HOOK": custom_dec_hook,
+        }
+        settings = MsgspecFieldSettings(user_settings=user_settings)
+        assert settings.enc_hook is custom_enc_hook
+        assert settings._cached_attrs == {"ENC_HOOK"}
+        assert settings.__dict__["ENC_HOOK"] is custom_enc_hook
+
+        assert settings.dec_hook is custom_dec_hook
+        assert settings._cached_attrs == {"ENC_HOOK", "DEC_HOOK"}
+
+    def test_invalid_import_string_only_fails_its_setting(self):
+        """Test that a bad dotted path does not break access to the other settings."""
+        user_settings = {
+            "ENC_HOOK": custom_enc_hook,
+            "DEC_HOOK": "nonexistent.module.hook",
+        }
+        settings = MsgspecFieldSettings(user_settings=user_settings)
+        assert settings.enc_hook is custom_enc_hook
+        with pytest.raises(ImportError, match="DEC_HOOK"):
+            _ = settings.dec_hook
+
     def test_invalid_setting(self):
         """Test that accessing invalid settings raises AttributeError."""
         settings = MsgspecFieldSettings()
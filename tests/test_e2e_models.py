@@ -5,7 +5,7 @@ from django.core import serializers
 from django.db.models import F, Q, JSONField, Value
 
 from tests.conftest import InnerSchema
-from tests.test_app.models import ExampleModel, SampleModel
+from tests.test_app.models import ExampleModel, SampleModel, SampleMsgpackModel
 
 pytestmark = [
     pytest.mark.usefixtures("available_database_backends"),
@@ -38,15 +38,26 @@ pytestmark = [
         ),
     ],
 )
-def test_model_db_serde(initial_payload, expected_values):
-    instance = SampleModel(**initial_payload)
+@pytest.mark.parametrize("Model", [SampleModel, SampleMsgpackModel])
+def test_model_db_serde(Model, initial_payload, expected_values):
+    instance = Model(**initial_payload)
     instance.save()
 
-    instance = SampleModel.objects.get(pk=instance.pk)
+    instance = Model.objects.get(pk=instance.pk)
     instance_values = {k: getattr(instance, k) for k in expected_values.keys()}
     assert instance_values == expected_values
 
 
+def test_msgpack_model_exact_lookup():
+    instance = SampleMsgpackModel(sample_field={"stub_str": "abc", "stub_list": ["2023-06-01"]})
+    instance.save()
+
+    lookup_value = InnerSchema(stub_str="abc", stub_list=[date(2023, 6, 1)])
+    assert SampleMsgpackModel.objects.get(sample_field=lookup_value).pk == instance.pk
+    assert SampleMsgpackModel.objects.get(sample_field={"stub_str": "abc", "stub_list": ["2023-06-01"]}).pk == instance.pk
+    assert not SampleMsgpackModel.objects.filter(sample_field={"stub_str": "abcd", "stub_list": []}).exists()
+
+
 @pytest.mark.parametrize(
     "Model,payload,update_fields",
     [
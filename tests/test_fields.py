@@ -1,18 +1,22 @@
+import functools
 import json
 import sys
+import types
 import typing as ty
 from collections import abc
 from copy import copy
 from datetime import date
 
+import msgspec
 import pytest
+import typing_extensions as te
 from django.core.exceptions import ValidationError
 from django.db import connection, models
 from django.db.migrations.writer import MigrationWriter
 
 from django_msgspec_field import fields
 
-from .conftest import InnerSchema, SampleDataclass, SchemaWithCustomTypes  # noqa
+from .conftest import InnerSchema, SampleDataclass, SchemaWithCustomTypes, compile_expression  # noqa
 from .sample_app.models import Building
 from .test_app.models import SampleForwardRefModel, SampleModel, SampleSchema
 
@@ -34,7 +38,7 @@ def test_sample_field():
 
     # Compare parsed JSON (key order may differ)
     db_value = sample_field.get_db_prep_value(existing_instance, connection)
-    assert json.loads(db_value) == expected_encoded
+    assert msgspec.json.decode(db_value) == expected_encoded
     assert sample_field.to_python(expected_encoded) == existing_instance
 
 
@@ -46,7 +50,7 @@ def test_sample_field_with_raw_data():
 
     # Compare parsed JSON (key order may differ)
     db_value = sample_field.get_db_prep_value(existing_raw, connection)
-    assert json.loads(db_value) == expected_encoded
+    assert msgspec.json.decode(db_value) == expected_encoded
     assert sample_field.to_python(expected_encoded) == InnerSchema(**existing_raw)
 
 
@@ -59,6 +63,55 @@ def test_null_field():
     assert field.get_prep_value(None) is None
 
 
+@pytest.mark.parametrize(
+    "schema",
+    [InnerSchema, ty.Optional[InnerSchema], ty.Union[InnerSchema, SampleDataclass]],
+)
+def test_schema_instance_passed_through(schema):
+    field = fields.MsgspecSchemaField(schema=schema)
+    existing_instance = InnerSchema(stub_str="abc", stub_list=[date(2022, 7, 1)])
+    assert field.to_python(existing_instance) is existing_instance
+
+
+class InnerSchemaSubclass(InnerSchema):
+    secret: str = "pw"
+
+
+@pytest.mark.parametrize("schema", [InnerSchema, ty.Optional[InnerSchema]])
+def test_schema_subclass_instance_validated(schema):
+    field = fields.MsgspecSchemaField(schema=schema)
+    subclass_instance = InnerSchemaSubclass(stub_str="abc", stub_list=[date(2022, 7, 1)])
+
+    assert not field.adapter.is_schema_instance(subclass_instance)
+    with pytest.raises(ValidationError):
+        field.to_python(subclass_instance)
+
+
+class SampleTypedDict(te.TypedDict):
+    stub_str: str
+
+
+@pytest.mark.parametrize(
+    "schema, value, expected",
+    [
+        (SampleTypedDict, {"stub_str": "abc"}, {"stub_str": "abc"}),
+        (ty.Optional[SampleTypedDict], {"stub_str": "abc"}, {"stub_str": "abc"}),
+        (ty.Any, {"stub_str": "abc"}, {"stub_str": "abc"}),
+        (int, 1, 1),
+    ],
+)
+def test_non_instance_checkable_schemas(schema, value, expected):
+    field = fields.MsgspecSchemaField(schema=schema, null=True)
+    assert field.to_python(value) == expected
+    assert field.get_prep_value(value) == expected
+
+
+def test_scalar_schema_subclass_not_passed_through():
+    field = fields.MsgspecSchemaField(schema=int)
+    with pytest.raises(ValidationError):
+        field.to_python(True)
+
+
 def test_forwardrefs_deferred_resolution():
     obj = SampleForwardRefModel(field={}, annotated_field={})
     assert isinstance(obj.field, SampleSchema)
@@ -215,6 +268,68 @@ def test_export_kwargs_support(export_kwargs):
     assert field.get_prep_value(existing_instance)
 
 
+def test_default_value_checks_cached_per_field():
+    first = fields.MsgspecSchemaField(schema=InnerSchema, default={"stub_int": "abc"})
+    second = fields.MsgspecSchemaField(schema=InnerSchema, default={"stub_int": "abc"})
+
+    for field in (first, second, first):
+        default_checks = [check for check in field._check_default_value() if check.id == "msgspec.E002"]
+        assert len(default_checks) == 1
+        assert default_checks[0].obj is field
+
+
+@pytest.mark.parametrize("none_default_first", [True, False])
+def test_default_value_checks_distinguish_none_from_missing_default(none_default_first, monkeypatch):
+    monkeypatch.setattr(fields, "_default_check_cache", {})
+    none_default = fields.MsgspecSchemaField(schema=InnerSchema, default=None)
+    no_default = fields.MsgspecSchemaField(schema=InnerSchema)
+
+    ordered = (none_default, no_default) if none_default_first else (no_default, none_default)
+    check_ids = {field: [check.id for check in field._check_default_value()] for field in ordered}
+    assert "msgspec.E002" in check_ids[none_default]
+    assert "msgspec.E002" not in check_ids[no_default]
+
+
+def test_export_kwargs_integrity_warning():
+    field = fields.MsgspecSchemaField(
+        schema=InnerSchema,
+        default=InnerSchema(stub_str="abc", stub_list=[]),
+        exclude={"stub_str"},
+    )
+    assert [check.id for check in field._check_default_value()] == ["msgspec.W003"]
+
+
+def test_deconstruct_cached_copies():
+    field = fields.MsgspecSchemaField(schema=InnerSchema, default={"stub_str": "abc", "stub_list": []})
+    _, _, _, kwargs = field.deconstruct()
+    kwargs["default"] = None
+
+    _, _, _, fresh_kwargs = field.deconstruct()
+    assert fresh_kwargs["default"] == {"stub_str": "abc", "stub_int": 1, "stub_list": []}
+
+    field.null = True
+    _, _, _, null_kwargs = field.deconstruct()
+    assert null_kwargs["null"] is True
+
+    field.default = {"stub_str": "abcd", "stub_list": []}
+    _, _, _, default_kwargs = field.deconstruct()
+    assert default_kwargs["default"] == {"stub_str": "abcd", "stub_int": 1, "stub_list": []}
+
+
+@pytest.mark.parametrize(
+    "export_kwargs, expected",
+    [
+        ({"include": {"stub_str"}}, {"stub_str": "abc"}),
+        ({"exclude": {"stub_list"}}, {"stub_str": "abc", "stub_int": 1}),
+        ({"exclude_defaults": True}, {"stub_str": "abc", "stub_list": []}),
+    ],
+)
+def test_export_kwargs_struct_filtering(export_kwargs, expected):
+    field = fields.MsgspecSchemaField(schema=InnerSchema, **export_kwargs)
+    existing_instance = InnerSchema(stub_str="abc", stub_list=[])
+    assert field.adapter.dump_python(existing_instance) == expected
+
+
 def _test_field_serialization(field):
     _, _, args, kwargs = field.deconstruct()
 
@@ -231,43 +346,23 @@ def _test_field_serialization(field):
 
 def _schemas_equivalent(schema1, schema2):
     """Compare schemas for equivalence, handling typing.List vs list etc."""
-    if schema1 == schema2:
-        return True
-
-    # Get origins and args for generic types
-    origin1 = ty.get_origin(schema1)
-    origin2 = ty.get_origin(schema2)
-    args1 = ty.get_args(schema1)
-    args2 = ty.get_args(schema2)
-
-    # Handle list vs typing.List, dict vs typing.Dict etc
-    if origin1 is not None and origin2 is not None:
-        # Normalize origins (typing.List -> list, typing.Dict -> dict, etc.)
-        normalized_origin1 = origin1 if not hasattr(origin1, "__mro__") else origin1
-        normalized_origin2 = origin2 if not hasattr(origin2, "__mro__") else origin2
-
-        # Compare list/List, dict/Dict, etc.
-        if normalized_origin1 == normalized_origin2 or (
-            # list vs typing.List
-            (normalized_origin1 is list and origin2 is list)
-            or (normalized_origin2 is list and origin1 is list)
-            or (normalized_origin1 is dict and origin2 is dict)
-            or (normalized_origin2 is dict and origin1 is dict)
-        ):
-            if len(args1) != len(args2):
-                return False
-            return all(_schemas_equivalent(a1, a2) for a1, a2 in zip(args1, args2))
-
-    # Handle Union types (including Optional)
-    if origin1 is ty.Union and origin2 is ty.Union:
-        # Sort args to handle order differences
-        sorted_args1 = sorted(args1, key=str)
-        sorted_args2 = sorted(args2, key=str)
-        if len(sorted_args1) != len(sorted_args2):
-            return False
-        return all(_schemas_equivalent(a1, a2) for a1, a2 in zip(sorted_args1, sorted_args2))
-
-    return False
+    return _canonical_schema(schema1) == _canonical_schema(schema2)
+
+
+@functools.cache
+def _canonical_schema(schema):
+    origin = ty.get_origin(schema)
+    if origin is None:
+        return schema
+
+    args = tuple(map(_canonical_schema, ty.get_args(schema)))
+    # `X | Y` and `typing.Union[X, Y]` are the same union, regardless of the members order
+    if origin is ty.Union or (sys.version_info >= (3, 10) and origin is types.UnionType):
+        return ty.Union, tuple(sorted(args, key=repr))
+    return _NORMALIZED_ORIGINS.get(origin, origin), args
+
+
+_NORMALIZED_ORIGINS = {ty.List: list, ty.Dict: dict, ty.Tuple: tuple, ty.Set: set}
 
 
 def serialize_field(field: fields.MsgspecSchemaField) -> str:
@@ -276,7 +371,7 @@ def serialize_field(field: fields.MsgspecSchemaField) -> str:
 
 
 def reconstruct_field(field_repr: str) -> fields.MsgspecSchemaField:
-    return eval(field_repr, globals(), sys.modules)
+    return eval(compile_expression(field_repr), globals(), sys.modules)
 
 
 def test_copy_field():
@@ -287,8 +382,86 @@ def test_copy_field():
     assert copied.concrete == Building.meta.field.concrete
 
 
+def test_schema_adapters_unhashable():
+    # Adapters compare by their binding, which `bind()` changes after construction
+    field = fields.MsgspecSchemaField(schema=InnerSchema)
+    assert field.adapter == copy(field.adapter)
+    with pytest.raises(TypeError):
+        hash(field.adapter)
+
+
+def test_copy_field_adapter_not_shared():
+    field = Building.meta.field
+    copied = copy(field)
+
+    assert copied.adapter is not field.adapter
+    assert copied.adapter.prepared_schema is field.adapter.prepared_schema
+
+    copied.adapter.bind(SampleModel, "meta")
+    assert field.adapter.parent_type is Building
+
+
+def test_transform_cache_bounded_to_registered_lookups():
+    field = fields.MsgspecSchemaField(schema=InnerSchema)
+
+    key_transform = field.get_transform("stub_str")
+    assert key_transform is not None
+    assert field.get_transform("stub_str") is not key_transform
+    assert field._transform_adapter_cache == {}
+
+    registered_transform = field.get_transform("contains")
+    assert field.get_transform("contains") is registered_transform
+    assert set(field._transform_adapter_cache) == {"contains"}
+
+
+def test_msgpack_field_has_no_json_encoder():
+    field = fields.MsgspecSchemaField(schema=InnerSchema, format="msgpack")
+    _, _, _, kwargs = field.deconstruct()
+
+    assert field.encoder is None
+    assert "encoder" not in kwargs
+    assert kwargs["format"] == "msgpack"
+
+
 def test_model_init_no_default():
     try:
         SampleModel()
     except Exception:
         pytest.fail("Model with schema field without a default value should be able to initialize")
+
+
+class _StubJsonb:
+    def __init__(self, obj, dumps):
+        self.obj = obj
+        self.dumps = dumps
+
+
+@pytest.fixture
+def postgresql_connection(monkeypatch):
+    # psycopg is not required to build the jsonb parameter, only its `Jsonb` wrapper is stubbed
+    psycopg_any = types.ModuleType("django.db.backends.postgresql.psycopg_any")
+    psycopg_any.Jsonb = _StubJsonb  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "django.db.backends.postgresql.psycopg_any", psycopg_any)
+    return types.SimpleNamespace(vendor="postgresql", ops=types.SimpleNamespace(adapt_json_value=None))
+
+
+def test_postgresql_db_prep_value_encoded_with_msgspec(postgresql_connection):
+    field = fields.MsgspecSchemaField(schema=InnerSchema)
+    value = InnerSchema(stub_str="abc", stub_list=[date(2022, 7, 1)])
+
+    prep_value = field.get_db_prep_value(value, postgresql_connection)
+    assert isinstance(prep_value, _StubJsonb)
+    assert prep_value.obj == {"stub_str": "abc", "stub_list": ["2022-07-01"], "stub_int": 1}
+    assert json.loads(prep_value.dumps(prep_value.obj)) == prep_value.obj
+
+
+@pytest.mark.parametrize("number", [float("nan"), float("inf"), float("-inf")])
+def test_postgresql_db_prep_value_rejects_non_finite_floats(postgresql_connection, number):
+    field = fields.MsgspecSchemaField(schema=dict[str, list[float | None]])
+
+    prep_value = field.get_db_prep_value({"values": [None, number]}, postgresql_connection)
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        prep_value.dumps(prep_value.obj)
+
+    prep_value = field.get_db_prep_value({"values": [None, 1.5]}, postgresql_connection)
+    assert prep_value.dumps(prep_value.obj) == '{"values":[null,1.5]}'
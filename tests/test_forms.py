@@ -0,0 +1,78 @@
+from datetime import date
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.forms.fields import JSONString
+
+from django_msgspec_field import forms
+
+from .conftest import InnerSchema
+
+
+class InnerSchemaSubclass(InnerSchema):
+    secret: str = "pw"
+
+
+class SchemaDict(dict):
+    pass
+
+
+@pytest.fixture
+def schema_instance():
+    return InnerSchema(stub_str="abc", stub_list=[date(2022, 7, 1)])
+
+
+def test_schema_instance_passed_through(schema_instance):
+    field = forms.SchemaField(schema=InnerSchema)
+    assert field.to_python(schema_instance) is schema_instance
+    assert field.prepare_value(schema_instance) == '{"stub_str":"abc","stub_list":["2022-07-01"],"stub_int":1}'
+
+
+def test_schema_subclass_instance_rejected():
+    field = forms.SchemaField(schema=InnerSchema)
+    with pytest.raises(ValidationError):
+        field.to_python(InnerSchemaSubclass(stub_str="abc", stub_list=[]))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        '{"stub_str": "abc", "stub_list": ["2022-07-01"]}',
+        b'{"stub_str": "abc", "stub_list": ["2022-07-01"]}',
+        {"stub_str": "abc", "stub_list": ["2022-07-01"]},
+        SchemaDict(stub_str="abc", stub_list=["2022-07-01"]),
+    ],
+)
+def test_to_python_coerces_by_value_type(value, schema_instance):
+    field = forms.SchemaField(schema=InnerSchema)
+    assert field.to_python(value) == schema_instance
+
+
+def test_to_python_json_string_kept():
+    field = forms.SchemaField(schema=InnerSchema)
+    value = JSONString('{"stub_str": "abc"}')
+    result = field.to_python(value)
+    assert isinstance(result, JSONString)
+    assert result == value
+
+
+def test_disabled_bound_data_typed_initial(schema_instance):
+    field = forms.SchemaField(schema=InnerSchema, disabled=True)
+    assert field.bound_data(None, schema_instance) is schema_instance
+    assert field.bound_data(None, {"stub_str": "abc", "stub_list": ["2022-07-01"]}) == schema_instance
+
+
+def test_has_changed_after_initial_mutated_in_place():
+    field = forms.SchemaField(schema=InnerSchema)
+    initial = InnerSchema(stub_str="abc", stub_list=[date(2022, 7, 1)])
+    data = '{"stub_str": "abc", "stub_list": ["2022-07-01"]}'
+    assert not field.has_changed(initial, data)
+
+    initial.stub_str = "xyz"
+    assert field.has_changed(initial, data)
+
+    initial_dict = {"stub_str": "abc", "stub_list": ["2022-07-01"]}
+    assert not field.has_changed(initial_dict, data)
+
+    initial_dict["stub_str"] = "xyz"
+    assert field.has_changed(initial_dict, data)
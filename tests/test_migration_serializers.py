@@ -1,3 +1,4 @@
+import dataclasses
 import sys
 import types
 import typing as t
@@ -8,6 +9,10 @@ import pytest
 
 import django_msgspec_field
 
+from django_msgspec_field.compat.django import DataclassContainer
+
+from .conftest import compile_expression
+
 try:
     from django_msgspec_field.compat.django import GenericContainer
 except ImportError:
@@ -53,7 +58,7 @@ def test_serialize_eval_idempotent(raw_type):
         typing=t, typing_extensions=te, django_msgspec_field=django_msgspec_field, annotationlib=annotationlib,
         types=types,
     )
-    assert eval(expression, imports) == raw_type
+    assert eval(compile_expression(expression), imports) == raw_type
 
 
 @pytest.mark.skipif(sys.version_info < (3, 10), reason="UnionType requires Python 3.10+")
@@ -87,3 +92,92 @@ class TestUnionTypeUnwrap:
         list_container = GenericContainer(list, (union_container,))
         result = GenericContainer.unwrap(list_container)
         assert result == list[int | str]
+
+
+@dataclasses.dataclass
+class InnerDataclass:
+    value: int
+
+
+@dataclasses.dataclass
+class OuterDataclass:
+    name: str
+    inner: InnerDataclass
+
+
+def test_dataclass_container_nested_roundtrip():
+    value = OuterDataclass("foo", InnerDataclass(1))
+    wrapped = DataclassContainer.wrap(value)
+    assert wrapped.kwargs == {"name": "foo", "inner": InnerDataclass(1)}
+    assert DataclassContainer.unwrap(wrapped) == value
+
+    expression, _ = MigrationWriter.serialize(wrapped)
+    assert expression == (
+        "tests.test_migration_serializers.OuterDataclass("
+        "name='foo', inner=tests.test_migration_serializers.InnerDataclass(value=1))"
+    )
+
+
+@dataclasses.dataclass
+class CollectionDataclass:
+    items: list
+    pair: tuple
+    mapping: dict
+
+
+def test_dataclass_container_nested_in_collections():
+    value = CollectionDataclass([InnerDataclass(1)], (InnerDataclass(2),), {"key": InnerDataclass(3)})
+    expression, imports = MigrationWriter.serialize(DataclassContainer.wrap(value))
+    assert expression == (
+        "tests.test_migration_serializers.CollectionDataclass("
+        "items=[tests.test_migration_serializers.InnerDataclass(value=1)], "
+        "pair=(tests.test_migration_serializers.InnerDataclass(value=2),), "
+        "mapping={'key': tests.test_migration_serializers.InnerDataclass(value=3)})"
+    )
+    assert imports == {"import tests.test_migration_serializers"}
+
+
+def test_wrap_unwrap_cached():
+    raw_type = dict[str, list[int]]
+    wrapped_type = GenericContainer.wrap(raw_type)
+    assert GenericContainer.wrap(raw_type) is wrapped_type
+    assert GenericContainer.unwrap(GenericContainer(dict, (str, GenericContainer(list, (int,))))) == raw_type
+
+
+def test_wrap_unwrap_cache_is_type_strict():
+    assert GenericContainer.unwrap(GenericContainer(t.Literal, (1,))) == t.Literal[1]
+    assert t.get_args(GenericContainer.unwrap(GenericContainer(t.Literal, (True,)))) == (True,)
+    assert type(t.get_args(GenericContainer.unwrap(GenericContainer(t.Literal, (True,))))[0]) is bool
+
+    assert GenericContainer.wrap(te.Annotated[int, 1]).args == (int, 1)
+    assert type(GenericContainer.wrap(te.Annotated[int, True]).args[1]) is bool
+
+
+def test_containers_are_unhashable():
+    # Containers compare equal to the raw generic types, so they cannot share their hash
+    assert GenericContainer(list, (int,)) == list[int]
+    with pytest.raises(TypeError):
+        hash(GenericContainer(list, (int,)))
+
+
+def test_unwrap_unhashable_container():
+    container = GenericContainer(list, [int])
+    assert GenericContainer.unwrap(container) == list[int]
+
+
+def test_containers_are_slotted():
+    container = GenericContainer(list, (int,))
+    assert not hasattr(container, "__dict__")
+    assert repr(container) == "GenericContainer(<class 'list'>, (<class 'int'>,))"
+
+
+def test_typing_serializers_registry():
+    from django.db.migrations.serializer import Serializer
+
+    from django_msgspec_field.compat.django import TypingSerializer, UnionType, UnionTypeSerializer
+
+    # Plain classes must be left to Django's TypeSerializer fallback
+    assert type not in Serializer._registry
+    for union_type in UnionType:
+        assert Serializer._registry[union_type] is UnionTypeSerializer
+    assert Serializer._registry[t.ForwardRef] is TypingSerializer
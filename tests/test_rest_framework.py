@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+import msgspec
+import pytest
+
+pytest.importorskip("rest_framework")
+
+from rest_framework import exceptions
+
+from django_msgspec_field.rest_framework import SchemaField, SchemaRenderer
+
+from .conftest import InnerSchema
+
+
+class InnerSchemaSubclass(InnerSchema):
+    secret: str = "pw"
+
+
+@pytest.fixture
+def schema_instance():
+    return InnerSchema(stub_str="abc", stub_list=[date(2022, 7, 1)])
+
+
+def test_field_schema_instance_passed_through(schema_instance):
+    field = SchemaField(schema=InnerSchema)
+    assert field.to_internal_value(schema_instance) is schema_instance
+    assert field.to_internal_value({"stub_str": "abc", "stub_list": ["2022-07-01"]}) == schema_instance
+    assert field.to_representation(schema_instance) == {"stub_str": "abc", "stub_list": ["2022-07-01"], "stub_int": 1}
+
+
+def test_field_schema_subclass_instance_rejected():
+    field = SchemaField(schema=InnerSchema)
+    with pytest.raises(exceptions.ValidationError):
+        field.to_internal_value(InnerSchemaSubclass(stub_str="abc", stub_list=[]))
+
+
+def test_renderer_schema_instance(schema_instance):
+    rendered = SchemaRenderer[InnerSchema]().render(schema_instance)
+    assert msgspec.json.decode(rendered, type=InnerSchema) == schema_instance
+
+
+def test_renderer_validation_error_payload():
+    rendered = SchemaRenderer[InnerSchema]().render({"stub_str": "abc"})
+    payload = msgspec.json.decode(rendered)
+    assert list(payload) == ["error"]
+    assert "stub_list" in payload["error"]
+
+
+def test_renderer_bare_struct(schema_instance):
+    rendered = SchemaRenderer().render(schema_instance)
+    assert rendered == b'{"stub_str":"abc","stub_list":["2022-07-01"],"stub_int":1}'
+
+
+def test_schema_generation_modules_loaded_lazily():
+    # A fresh interpreter is used, since other tests may have imported the schema modules already
+    code = """
+import sys
+import django
+
+django.setup()
+import django_msgspec_field.rest_framework as rest_framework
+
+assert "rest_framework.schemas" not in sys.modules
+assert "django_msgspec_field.rest_framework.openapi" not in sys.modules
+assert rest_framework.AutoSchema is sys.modules["django_msgspec_field.rest_framework.openapi"].AutoSchema
+assert rest_framework.coreapi is sys.modules["django_msgspec_field.rest_framework.coreapi"]
+"""
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "tests.settings.django_test_settings"}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env, cwd=Path(__file__).parents[1])
@@ -0,0 +1,31 @@
+import io
+
+import pytest
+
+pytest.importorskip("rest_framework")
+
+from rest_framework import exceptions
+
+from django_msgspec_field.rest_framework.parsers import SchemaParser
+
+from .conftest import InnerSchema
+
+PAYLOAD = b'{"stub_str": "abc", "stub_list": ["2022-07-01"]}'
+
+
+def test_parse_body_within_limit(settings):
+    settings.DATA_UPLOAD_MAX_MEMORY_SIZE = len(PAYLOAD)
+    result = SchemaParser[InnerSchema]().parse(io.BytesIO(PAYLOAD))
+    assert result.stub_str == "abc"
+
+
+def test_parse_body_over_limit(settings):
+    settings.DATA_UPLOAD_MAX_MEMORY_SIZE = len(PAYLOAD) - 1
+    with pytest.raises(exceptions.ParseError, match="DATA_UPLOAD_MAX_MEMORY_SIZE"):
+        SchemaParser[InnerSchema]().parse(io.BytesIO(PAYLOAD))
+
+
+def test_parse_body_without_limit(settings):
+    settings.DATA_UPLOAD_MAX_MEMORY_SIZE = None
+    result = SchemaParser[InnerSchema]().parse(io.BytesIO(PAYLOAD))
+    assert result.stub_str == "abc"